@@ -1,90 +1,390 @@
 # client.py
-from kubernetes import client, config
+import copy
+import functools
+import json
+import logging
+import threading
+import time
+from types import SimpleNamespace
+from kubernetes import client, config, watch
 from kubernetes.client.rest import ApiException
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup for raw list responses
+    _json_loads = json.loads
+
+logger = logging.getLogger(__name__)
+
+# kubeconfig path -> loaded Configuration, so further clients for the same file skip parsing it
+_configurations = {}
+_configurations_lock = threading.Lock()
+
+PARTIAL_METADATA_ACCEPT = "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1"
+
+class _PartialMetadataApiClient(client.ApiClient):
+    """ApiClient that asks the API server to return only object metadata."""
+    
+    def __init__(self, api_client):
+        """Wrap an ApiClient, sharing its configuration and REST client.
+        
+        ApiClient.__init__ is not called, since it would build a connection pool
+        that is never used; requests go through api_client's pool instead.
+        
+        Args:
+            api_client (kubernetes.client.ApiClient): Client whose state is shared.
+        """
+        self.__dict__.update(api_client.__dict__)
+        self.default_headers = dict(api_client.default_headers)
+    
+    def select_header_accept(self, accepts):
+        return PARTIAL_METADATA_ACCEPT
+
+def current_context(kubeconfig_path=None):
+    """Return the name of the active kubeconfig context, or None if it cannot be read.
+    
+    Args:
+        kubeconfig_path (str, optional): Path to kubeconfig file. Defaults to None (uses default kubeconfig).
+    """
+    try:
+        _, active_context = config.list_kube_config_contexts(config_file=kubeconfig_path)
+    except Exception:
+        return None
+    return active_context["name"] if active_context else None
+
+def _load_configuration(kubeconfig_path):
+    """Load a kubeconfig file once and return its cached Configuration.
+    
+    Args:
+        kubeconfig_path (str): Path to kubeconfig file, or None for the default kubeconfig.
+    
+    Returns:
+        kubernetes.client.Configuration: Configuration shared by all clients of this kubeconfig.
+    """
+    with _configurations_lock:
+        configuration = _configurations.get(kubeconfig_path)
+        if configuration is None:
+            configuration = client.Configuration()
+            config.load_kube_config(config_file=kubeconfig_path, client_configuration=configuration)
+            _configurations[kubeconfig_path] = configuration
+        return configuration
+
 class KubernetesClient:
     """Handles Kubernetes API interactions."""
     
-    def __init__(self, kubeconfig_path=None):
+    # Items requested per page; large lists are fetched in chunks via limit/continue
+    PAGE_SIZE = 500
+    
+    # Seconds the namespace list is served from cache; namespaces change far less often than workloads
+    NAMESPACE_CACHE_TTL = 30
+    
+    # Connections kept open per host, sized for the collector's concurrent list calls
+    CONNECTION_POOL_MAXSIZE = 64
+    
+    # Most cached lists kept at once; the oldest are dropped first
+    CACHE_MAX_ENTRIES = 256
+    
+    def __init__(self, kubeconfig_path=None, cache_ttl=60):
         """Initialize the Kubernetes client, loading kubeconfig.
         
         Args:
             kubeconfig_path (str, optional): Path to kubeconfig file. Defaults to None (uses default kubeconfig).
+            cache_ttl (float): Seconds a listed resource kind is served from cache. 0 disables caching.
         
         Raises:
             Exception: If kubeconfig loading fails.
         """
         try:
-            if kubeconfig_path:
-                config.load_kube_config(config_file=kubeconfig_path)
-            else:
-                config.load_kube_config()
+            configuration = _load_configuration(kubeconfig_path or None)
         except Exception as e:
             raise Exception(f"Failed to load kubeconfig: {e}")
         
-        self.core_v1 = client.CoreV1Api()
-        self.apps_v1 = client.AppsV1Api()
-        self.networking_v1 = client.NetworkingV1Api()
+        # One ApiClient, and so one connection pool, shared by every API group. The pool is
+        # sized on a copy, leaving the Configuration cached for this kubeconfig unchanged.
+        configuration = copy.copy(configuration)
+        configuration.connection_pool_maxsize = self.CONNECTION_POOL_MAXSIZE
+        api_client = client.ApiClient(configuration)
+        self.core_v1 = client.CoreV1Api(api_client)
+        self.apps_v1 = client.AppsV1Api(api_client)
+        self.networking_v1 = client.NetworkingV1Api(api_client)
+        
+        # (kind, namespace, page_parser) -> (expires_at, items); namespace is None for cluster-wide lists
+        self.cache_ttl = cache_ttl
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        
+        # Kinds that can be listed as metadata only: (namespaced list, cluster-wide list)
+        metadata_client = _PartialMetadataApiClient(api_client)
+        metadata_core_v1 = client.CoreV1Api(metadata_client)
+        metadata_networking_v1 = client.NetworkingV1Api(metadata_client)
+        self._metadata_lists = {
+            "secrets": (metadata_core_v1.list_namespaced_secret, metadata_core_v1.list_secret_for_all_namespaces),
+            "services": (metadata_core_v1.list_namespaced_service, metadata_core_v1.list_service_for_all_namespaces),
+            "pvcs": (metadata_core_v1.list_namespaced_persistent_volume_claim, metadata_core_v1.list_persistent_volume_claim_for_all_namespaces),
+            "ingresses": (metadata_networking_v1.list_namespaced_ingress, metadata_networking_v1.list_ingress_for_all_namespaces),
+        }
     
-    def list_namespaces(self):
-        """List all namespaces in the cluster."""
+    def _cached_list(self, kind, namespace, list_func, page_parser=None, cache=True):
+        """Return a resource list from cache, fetching it page by page when missing or expired.
+        
+        Args:
+            kind (str): Resource kind used in the cache key and error messages.
+            namespace (str): Namespace of the list, or None for a cluster-wide list.
+            list_func (callable): Kubernetes API list method, namespaced unless namespace is None.
+            page_parser (callable, optional): Fetches one page from list_func itself and parses the
+                raw response (e.g. _partial_metadata_page). Defaults to None (typed list responses).
+            cache (bool): Serve and store the list through the cache. Disabled for full pod and
+                secret objects, which only the YAML export reads and which are large (secret data).
+        
+        Returns:
+            list: Resource objects. Failed namespaced calls return an empty list and are not cached.
+        
+        Raises:
+            ApiException: If a cluster-wide list fails, e.g. for lack of cluster-scoped RBAC, so
+                callers can fall back to per-namespace lists instead of showing nothing.
+        """
+        key = (kind, namespace, page_parser)
+        entry = self._cache.get(key) if cache else None
+        if entry and time.monotonic() < entry[0]:
+            return entry[1]
         try:
-            return [ns.metadata.name for ns in self.core_v1.list_namespace().items]
+            args = () if namespace is None else (namespace,)
+            if page_parser is not None:
+                list_func = functools.partial(page_parser, list_func)
+            items = list(self._paginate(list_func, *args))
         except ApiException as e:
-            print(f"Error fetching namespaces: {e}")
+            if namespace is None:
+                raise
+            logger.warning("Error fetching %s in %s: %s", kind, namespace, e)
             return []
+        if cache:
+            self._store(key, self.cache_ttl, items)
+        return items
     
-    def list_deployments(self, namespace):
-        """List deployments in a namespace."""
+    def _store(self, key, ttl, items):
+        """Cache a list for ttl seconds.
+        
+        Expired entries are dropped first, then the oldest ones down to CACHE_MAX_ENTRIES,
+        so a client kept for a whole GUI session does not hold every list it ever fetched.
+        """
+        if not ttl:
+            return
+        now = time.monotonic()
+        with self._cache_lock:
+            for cached_key, (expires_at, _) in list(self._cache.items()):
+                if expires_at <= now:
+                    del self._cache[cached_key]
+            self._cache.pop(key, None)
+            while len(self._cache) >= self.CACHE_MAX_ENTRIES:
+                del self._cache[next(iter(self._cache))]
+            self._cache[key] = (now + ttl, items)
+    
+    def _paginate(self, list_func, *args):
+        """Yield the items of a list call page by page.
+        
+        Args:
+            list_func (callable): Kubernetes API list method.
+            *args: Positional arguments for list_func (e.g. the namespace).
+        
+        Yields:
+            Resource objects, one page of PAGE_SIZE items fetched at a time.
+        """
+        token = None
+        while True:
+            resp = list_func(*args, limit=self.PAGE_SIZE, _continue=token)
+            yield from resp.items
+            token = resp.metadata._continue
+            if not token:
+                break
+    
+    def _partial_metadata_page(self, list_func, *args, **kwargs):
+        """Fetch one PartialObjectMetadataList page and wrap it like a typed list response.
+        
+        The raw JSON is parsed directly since the generated models cannot deserialize
+        this content type. Items only carry metadata.name and metadata.namespace.
+        """
+        resp = list_func(*args, _preload_content=False, **kwargs)
+        data = _json_loads(resp.data)
+        items = [
+            SimpleNamespace(metadata=SimpleNamespace(name=item["metadata"]["name"], namespace=item["metadata"].get("namespace")))
+            for item in data.get("items") or []
+        ]
+        return SimpleNamespace(items=items, metadata=SimpleNamespace(_continue=data.get("metadata", {}).get("continue")))
+    
+    def _pod_summary_page(self, list_func, *args, **kwargs):
+        """Fetch one page of pods and keep only name, namespace, owners and phase."""
+        resp = list_func(*args, _preload_content=False, **kwargs)
+        data = _json_loads(resp.data)
+        items = []
+        for item in data.get("items") or []:
+            metadata = item["metadata"]
+            owners = [
+                SimpleNamespace(kind=owner.get("kind"), name=owner.get("name"))
+                for owner in metadata.get("ownerReferences") or []
+            ]
+            items.append(SimpleNamespace(
+                metadata=SimpleNamespace(name=metadata["name"], namespace=metadata.get("namespace"), owner_references=owners or None),
+                status=SimpleNamespace(phase=(item.get("status") or {}).get("phase")),
+            ))
+        return SimpleNamespace(items=items, metadata=SimpleNamespace(_continue=data.get("metadata", {}).get("continue")))
+    
+    def invalidate(self, kind=None, namespace=None):
+        """Drop cached lists.
+        
+        Args:
+            kind (str, optional): Only drop lists of this kind. Defaults to all kinds.
+            namespace (str, optional): Only drop this namespace's list (and the cluster-wide list
+                of the same kind, which contains it). Defaults to all namespaces.
+        """
+        with self._cache_lock:
+            for key in list(self._cache):
+                cached_kind, cached_ns = key[:2]
+                if kind is not None and cached_kind != kind:
+                    continue
+                if namespace is not None and cached_ns not in (namespace, None):
+                    continue
+                del self._cache[key]
+    
+    def watch_namespaces(self, callback):
+        """Report namespace changes to a callback until access is denied; run it in a daemon thread.
+        
+        The full namespace list is reported first, and again whenever the watch has to
+        restart from a fresh list, so only additions and deletions are transferred between.
+        Other errors are retried every 5 seconds; a 401 or 403 ends the watch, since
+        retrying cannot succeed without cluster-scoped namespace list rights.
+        
+        Args:
+            callback (callable): Called as callback("SYNC", names) with the full list of names,
+                and callback("ADDED" or "DELETED", name) for each change.
+        """
+        resource_version = None
+        while True:
+            try:
+                if resource_version is None:
+                    namespace_list = self.core_v1.list_namespace()
+                    resource_version = namespace_list.metadata.resource_version
+                    self.invalidate("namespaces")
+                    callback("SYNC", [ns.metadata.name for ns in namespace_list.items])
+                for event in watch.Watch().stream(self.core_v1.list_namespace, resource_version=resource_version, timeout_seconds=300):
+                    obj = event["object"]
+                    resource_version = obj.metadata.resource_version
+                    if event["type"] in ("ADDED", "DELETED"):
+                        self.invalidate("namespaces")
+                        callback(event["type"], obj.metadata.name)
+            except ApiException as e:
+                if e.status == 410:
+                    # Resource version too old: events were missed, relist and rewatch
+                    resource_version = None
+                elif e.status in (401, 403):
+                    logger.warning("Stopped watching namespaces: %s", e)
+                    return
+                else:
+                    logger.warning("Error watching namespaces: %s", e)
+                    time.sleep(5)
+            except Exception as e:
+                logger.warning("Error watching namespaces: %s", e)
+                time.sleep(5)
+    
+    def list_namespaces(self):
+        """List all namespaces in the cluster, cached for NAMESPACE_CACHE_TTL seconds."""
+        key = ("namespaces", None, False)
+        entry = self._cache.get(key)
+        if entry and time.monotonic() < entry[0]:
+            return entry[1]
         try:
-            return self.apps_v1.list_namespaced_deployment(namespace).items
+            names = [ns.metadata.name for ns in self.core_v1.list_namespace().items]
         except ApiException as e:
-            print(f"Error fetching deployments in {namespace}: {e}")
+            logger.warning("Error fetching namespaces: %s", e)
             return []
+        self._store(key, self.NAMESPACE_CACHE_TTL, names)
+        return names
+    
+    def list_deployments(self, namespace):
+        """List deployments in a namespace."""
+        return self._cached_list("deployments", namespace, self.apps_v1.list_namespaced_deployment)
     
     def list_statefulsets(self, namespace):
         """List statefulsets in a namespace."""
-        try:
-            return self.apps_v1.list_namespaced_stateful_set(namespace).items
-        except ApiException as e:
-            print(f"Error fetching statefulsets in {namespace}: {e}")
-            return []
+        return self._cached_list("statefulsets", namespace, self.apps_v1.list_namespaced_stateful_set)
+    
     def list_secrets(self, namespace):
         """List secret in a namespace"""
-        try:
-            return self.core_v1.list_namespaced_secret(namespace).items
-        except ApiException as e:
-            print(f"Error fetching secrets in {namespace}: {e}")
-            return []
-        
+        return self._cached_list("secrets", namespace, self.core_v1.list_namespaced_secret, cache=False)
+    
     def list_services(self, namespace):
         """List services in a namespace."""
-        try:
-            return self.core_v1.list_namespaced_service(namespace).items
-        except ApiException as e:
-            print(f"Error fetching services in {namespace}: {e}")
-            return []
+        return self._cached_list("services", namespace, self.core_v1.list_namespaced_service)
     
     def list_pvcs(self, namespace):
         """List persistent volume claims in a namespace."""
-        try:
-            return self.core_v1.list_namespaced_persistent_volume_claim(namespace).items
-        except ApiException as e:
-            print(f"Error fetching PVCs in {namespace}: {e}")
-            return []
+        return self._cached_list("pvcs", namespace, self.core_v1.list_namespaced_persistent_volume_claim)
     
     def list_ingresses(self, namespace):
         """List ingresses in a namespace."""
-        try:
-            return self.networking_v1.list_namespaced_ingress(namespace).items
-        except ApiException as e:
-            print(f"Error fetching ingresses in {namespace}: {e}")
-            return []
+        return self._cached_list("ingresses", namespace, self.networking_v1.list_namespaced_ingress)
     
     def list_pods(self, namespace):
         """List pods in a namespace."""
-        try:
-            return self.core_v1.list_namespaced_pod(namespace).items
-        except ApiException as e:
-            print(f"Error fetching pods in {namespace}: {e}")
-            return []
\ No newline at end of file
+        return self._cached_list("pods", namespace, self.core_v1.list_namespaced_pod, cache=False)
+    
+    def list_deployments_all(self):
+        """List deployments across all namespaces."""
+        return self._cached_list("deployments", None, self.apps_v1.list_deployment_for_all_namespaces)
+    
+    def list_statefulsets_all(self):
+        """List statefulsets across all namespaces."""
+        return self._cached_list("statefulsets", None, self.apps_v1.list_stateful_set_for_all_namespaces)
+    
+    def list_secrets_all(self):
+        """List secrets across all namespaces."""
+        return self._cached_list("secrets", None, self.core_v1.list_secret_for_all_namespaces, cache=False)
+    
+    def list_services_all(self):
+        """List services across all namespaces."""
+        return self._cached_list("services", None, self.core_v1.list_service_for_all_namespaces)
+    
+    def list_pvcs_all(self):
+        """List persistent volume claims across all namespaces."""
+        return self._cached_list("pvcs", None, self.core_v1.list_persistent_volume_claim_for_all_namespaces)
+    
+    def list_ingresses_all(self):
+        """List ingresses across all namespaces."""
+        return self._cached_list("ingresses", None, self.networking_v1.list_ingress_for_all_namespaces)
+    
+    def list_pods_all(self):
+        """List pods across all namespaces."""
+        return self._cached_list("pods", None, self.core_v1.list_pod_for_all_namespaces, cache=False)
+    
+    def list_metadata(self, kind, namespace=None):
+        """List only the metadata of a resource kind.
+        
+        Asks the API server for PartialObjectMetadataList so specs, data and status are
+        never sent over the wire. Used where only names and namespaces are needed.
+        
+        Args:
+            kind (str): One of "secrets", "services", "pvcs", "ingresses".
+            namespace (str, optional): Namespace to list. Defaults to None (all namespaces).
+        
+        Returns:
+            list: Objects exposing metadata.name and metadata.namespace.
+        """
+        namespaced_list, all_namespaces_list = self._metadata_lists[kind]
+        list_func = all_namespaces_list if namespace is None else namespaced_list
+        return self._cached_list(kind, namespace, list_func, page_parser=self._partial_metadata_page)
+    
+    def list_pod_summaries(self, namespace=None):
+        """List pods with only the fields used in summaries.
+        
+        The raw JSON is parsed without building the generated models, which for pods
+        means skipping container specs, env vars, volumes and conditions.
+        
+        Args:
+            namespace (str, optional): Namespace to list. Defaults to None (all namespaces).
+        
+        Returns:
+            list: Objects exposing metadata.name, metadata.namespace, metadata.owner_references
+                (kind and name of each owner, or None) and status.phase.
+        """
+        list_func = self.core_v1.list_pod_for_all_namespaces if namespace is None else self.core_v1.list_namespaced_pod
+        return self._cached_list("pods", namespace, list_func, page_parser=self._pod_summary_page)
\ No newline at end of file
@@ -1,42 +1,130 @@
+import functools
+import logging
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from .client import KubernetesClient
+from .names import RESOURCE_KINDS
+
+logger = logging.getLogger(__name__)
 
 class ResourceCollector:
     """Collects and processes Kubernetes resources from specified namespaces."""
     
-    def __init__(self, namespaces, database_namespaces, kubeconfig_path=None):
+    # Resource kinds in the order they are returned by collect_resources/collect_summary
+    RESOURCE_KINDS = RESOURCE_KINDS
+    
+    # Number of namespaces from which one cluster-wide list per kind beats per-namespace lists
+    ALL_NAMESPACES_THRESHOLD = 4
+    
+    # Concurrent API requests per collection unless max_workers is given
+    MAX_WORKERS = 16
+    
+    def __init__(self, namespaces, database_namespaces, kubeconfig_path=None, max_workers=None, all_namespaces=None, client=None):
         """Initialize the resource collector.
         
         Args:
             namespaces (list): List of namespaces to collect resources from.
+            database_namespaces (set): Namespaces for which deployments are skipped.
             kubeconfig_path (str, optional): Path to kubeconfig file.
+            max_workers (int, optional): Maximum number of concurrent API requests.
+                Defaults to None (MAX_WORKERS).
+            all_namespaces (bool, optional): Fetch each kind with one cluster-wide list call and
+                filter client-side. Defaults to None (enabled from ALL_NAMESPACES_THRESHOLD namespaces).
+            client (KubernetesClient, optional): Existing client to reuse, keeping its connection
+                pool and list cache. Defaults to a new client for kubeconfig_path.
         """
         self.namespaces = namespaces
         self.database_namespaces = database_namespaces
-        self.client = KubernetesClient(kubeconfig_path)
+        self.max_workers = max_workers or self.MAX_WORKERS
+        if all_namespaces is None:
+            all_namespaces = len(namespaces) >= self.ALL_NAMESPACES_THRESHOLD
+        self.all_namespaces = all_namespaces
+        self.client = client if client is not None else KubernetesClient(kubeconfig_path)
+        self._use_namespaces(namespaces)
+    
+    def _use_namespaces(self, namespaces):
+        """Precompute the namespaces each resource kind is collected from.
+        
+        Deployments are skipped for database namespaces; every other kind uses all of them.
+        """
+        self._all_ns = tuple(namespaces)
+        self._deploy_ns = tuple(ns for ns in namespaces if ns not in self.database_namespaces)
+    
+    def _namespaces_for(self, kind):
+        """Return the precomputed namespaces a resource kind is collected from."""
+        return self._deploy_ns if kind == "deployments" else self._all_ns
     
-    def shorten(self, name, max_len=30):
-        """Shorten a name with line breaks for display and return full name for tooltip.
+    def _iter_fetch(self, list_methods=None, kinds=None):
+        """Fetch every (namespace, resource kind) pair concurrently, yielding kinds as they complete.
+        
+        Each list call is an independent blocking API request, so they are all submitted
+        up front to a bounded thread pool and overlap in flight instead of running one by one.
+        With all_namespaces set, one cluster-wide list per kind replaces the
+        per-namespace calls and results are filtered to the selected namespaces. A kind
+        whose cluster-wide list fails (e.g. without cluster-scoped RBAC) is listed again
+        namespace by namespace rather than coming back empty.
+        
+        Args:
+            list_methods (dict, optional): Resource kind mapped to a client method taking the
+                namespace (None for all namespaces), replacing the default list_<kind> calls.
+            kinds (iterable, optional): Resource kinds to fetch. Defaults to all RESOURCE_KINDS.
+        
+        Yields:
+            tuple: (kind, list of raw objects ordered by namespace), in RESOURCE_KINDS order,
+                each as soon as that kind's list calls have finished.
+        """
+        kinds = [kind for kind in self.RESOURCE_KINDS if kinds is None or kind in kinds]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            
+            def submit(kind, namespaces):
+                futures = []
+                for ns in namespaces:
+                    if list_methods and kind in list_methods:
+                        future = executor.submit(list_methods[kind], ns)
+                    elif ns is None:
+                        future = executor.submit(getattr(self.client, f"list_{kind}_all"))
+                    else:
+                        future = executor.submit(getattr(self.client, f"list_{kind}"), ns)
+                    futures.append((ns, future))
+                return futures
+            
+            futures = {
+                kind: submit(kind, (None,) if self.all_namespaces else self._namespaces_for(kind))
+                for kind in kinds
+            }
+            for kind in kinds:
+                results = {}
+                pending = futures[kind]
+                while pending:
+                    retry = []
+                    for ns, future in pending:
+                        try:
+                            items = future.result()
+                        except Exception as e:
+                            if ns is None:
+                                logger.warning("Cluster-wide list of %s failed, listing per namespace: %s", kind, e)
+                                retry = submit(kind, self._namespaces_for(kind))
+                            else:
+                                logger.warning("Error fetching %s in namespace %s: %s", kind, ns, e)
+                            continue
+                        if ns is not None:
+                            results[ns] = items
+                            continue
+                        for obj in items:
+                            results.setdefault(obj.metadata.namespace, []).append(obj)
+                    pending = retry
+                yield kind, [obj for ns in self._namespaces_for(kind) for obj in results.get(ns, [])]
+    
+    def _fetch(self, list_methods=None):
+        """Fetch every (namespace, resource kind) pair concurrently.
         
         Args:
-            name (str): Resource name to shorten.
-            max_len (int): Maximum length before wrapping.
+            list_methods (dict, optional): See _iter_fetch.
         
         Returns:
-            tuple: (display_name, full_name)
+            dict: Resource kind mapped to the list of raw objects, ordered by namespace.
         """
-        if len(name) <= max_len:
-            return name, name
-        parts = name.split("-")
-        wrapped = ""
-        current_len = 0
-        for part in parts:
-            if current_len + len(part) > max_len:
-                wrapped += "\\n" + part
-                current_len = len(part)
-            else:
-                wrapped += ("-" if wrapped else "") + part
-                current_len += len(part) + 1
-        return wrapped, name
+        return dict(self._iter_fetch(list_methods))
     
     def collect_resources(self):
         """Collect deployments, statefulsets, services, PVCs, ingresses, and pods from all namespaces.
@@ -44,60 +132,36 @@ class ResourceCollector:
         Returns:
             tuple: Lists of raw Kubernetes resource objects (deployments, statefulsets, services, pvcs, ingresses, pods, secrets).
         """
-        deployments = []
-        statefulsets = []
-        services = []
-        pvcs = []
-        ingresses = []
-        pods = []
-        secrets = []
-        for ns in self.namespaces:
-            try:
-                # Fetch deployments (skip for database namespaces)
-                if ns not in self.database_namespaces:
-                    try:
-                        deployments.extend(self.client.list_deployments(ns))
-                    except Exception as e:
-                        print(f"Error fetching deployments in namespace {ns}: {str(e)}")
-                
-                # Fetch statefulsets (prioritize for database namespaces)
-                try:
-                    statefulsets.extend(self.client.list_statefulsets(ns))
-                except Exception as e:
-                    print(f"Error fetching statefulsets in namespace {ns}: {str(e)}")
-                
-                # Fetch services
-                try:
-                    services.extend(self.client.list_services(ns))
-                except Exception as e:
-                    print(f"Error fetching services in namespace {ns}: {str(e)}")
-                
-                # Fetch PVCs
-                try:
-                    pvcs.extend(self.client.list_pvcs(ns))
-                except Exception as e:
-                    print(f"Error fetching PVCs in namespace {ns}: {str(e)}")
-                
-                # Fetch ingresses
-                try:
-                    ingresses.extend(self.client.list_ingresses(ns))
-                except Exception as e:
-                    print(f"Error fetching ingresses in namespace {ns}: {str(e)}")
-                
-                # Fetch pods with status
-                try:
-                    pods.extend(self.client.list_pods(ns))
-                except Exception as e:
-                    print(f"Error fetching pods in namespace {ns}: {str(e)}")
-                
-                # Fetch secrets
-                try:
-                    secrets.extend(self.client.list_secrets(ns))
-                except Exception as e:
-                    print(f"Error fetching secrets in namespace {ns}: {str(e)}")
-            except Exception as e:
-                print(f"Error processing namespace {ns}: {str(e)}")
-        return deployments, statefulsets, services, pvcs, ingresses, pods, secrets
+        fetched = self._fetch()
+        return tuple(fetched[kind] for kind in self.RESOURCE_KINDS)
+    
+    @staticmethod
+    def _summarize(kind, obj):
+        """Build the summary tuple of one resource object.
+        
+        Namespaces and pod phases are interned: they repeat across thousands of rows,
+        which then share one string object each.
+        """
+        ns = sys.intern(obj.metadata.namespace)
+        if kind in ("deployments", "statefulsets"):
+            return (obj.metadata.name, obj.status.replicas or 0, ns)
+        if kind == "pods":
+            phase = obj.status.phase
+            return (obj.metadata.name, obj.metadata.owner_references, ns, sys.intern(phase) if phase else phase)
+        return (obj.metadata.name, ns)
+    
+    def _summary_list_methods(self):
+        """Return the list methods used for summaries.
+        
+        Only names and namespaces are summarized for services, PVCs, ingresses and secrets,
+        and a few fields for pods, so those kinds skip full object deserialization.
+        """
+        list_methods = {
+            kind: functools.partial(self.client.list_metadata, kind)
+            for kind in ("services", "pvcs", "ingresses", "secrets")
+        }
+        list_methods["pods"] = self.client.list_pod_summaries
+        return list_methods
     
     def collect_summary(self):
         """Collect summarized data for visualizations.
@@ -105,58 +169,33 @@ class ResourceCollector:
         Returns:
             tuple: Lists of summarized data (name, replicas/count, namespace) for each resource type.
         """
-        deployments, statefulsets, services, pvcs, ingresses, pods, secrets = [], [], [], [], [], [], []
-        for ns in self.namespaces:
-            try:
-                # Fetch deployments (skip for database namespaces)
-                if ns not in self.database_namespaces:
-                    try:
-                        for d in self.client.list_deployments(ns):
-                            deployments.append((d.metadata.name, d.status.replicas or 0, ns))
-                    except Exception as e:
-                        print(f"Error fetching deployments in namespace {ns}: {str(e)}")
-                
-                # Fetch statefulsets (prioritize for database namespaces)
-                try:
-                    for s in self.client.list_statefulsets(ns):
-                        statefulsets.append((s.metadata.name, s.status.replicas or 0, ns))
-                except Exception as e:
-                        print(f"Error fetching statefulsets in namespace {ns}: {str(e)}")
-                
-                # Fetch services
-                try:
-                    for s in self.client.list_services(ns):
-                        services.append((s.metadata.name, ns))
-                except Exception as e:
-                    print(f"Error fetching services in namespace {ns}: {str(e)}")
-                
-                # Fetch PVCs
-                try:
-                    for p in self.client.list_pvcs(ns):
-                        pvcs.append((p.metadata.name, ns))
-                except Exception as e:
-                    print(f"Error fetching PVCs in namespace {ns}: {str(e)}")
-                
-                # Fetch ingresses
-                try:
-                    for i in self.client.list_ingresses(ns):
-                        ingresses.append((i.metadata.name, ns))
-                except Exception as e:
-                    print(f"Error fetching ingresses in namespace {ns}: {str(e)}")
-                
-                # Fetch pods with status
-                try:
-                    for p in self.client.list_pods(ns):
-                        pods.append((p.metadata.name, p.metadata.owner_references, ns, p.status.phase))
-                except Exception as e:
-                    print(f"Error fetching pods in namespace {ns}: {str(e)}")
-                
-                # Fetch secrets with status
-                try:
-                    for s in self.client.list_secrets(ns):
-                        secrets.append((s.metadata.name, ns))
-                except Exception as e:
-                    print(f"Error fetching secrets in namespace {ns}: {str(e)}")
-            except Exception as e:
-                print(f"Error processing namespace {ns}: {str(e)}")
-        return deployments, statefulsets, services, pvcs, ingresses, pods, secrets
\ No newline at end of file
+        summaries = dict(self.iter_summary_lists())
+        return tuple(summaries[kind] for kind in self.RESOURCE_KINDS)
+    
+    def iter_summary_lists(self, kinds=None):
+        """Yield the summary list of each resource kind as soon as that kind has been fetched.
+        
+        Args:
+            kinds (iterable, optional): Resource kinds to collect. Defaults to all RESOURCE_KINDS.
+        
+        Yields:
+            tuple: (kind, list of summary tuples as in collect_summary), in RESOURCE_KINDS order.
+        """
+        for kind, objects in self._iter_fetch(self._summary_list_methods(), kinds):
+            yield kind, [self._summarize(kind, obj) for obj in objects]
+    
+    def iter_summary(self, kinds=None):
+        """Yield summaries one resource at a time instead of building all lists first.
+        
+        Kinds are yielded in RESOURCE_KINDS order, each as soon as its list calls finish,
+        so consumers can start writing while later kinds are still being fetched.
+        
+        Args:
+            kinds (iterable, optional): Resource kinds to collect. Defaults to all RESOURCE_KINDS.
+        
+        Yields:
+            tuple: (kind, summary tuple), with the same tuples as collect_summary.
+        """
+        for kind, objects in self._iter_fetch(self._summary_list_methods(), kinds):
+            for obj in objects:
+                yield kind, self._summarize(kind, obj)
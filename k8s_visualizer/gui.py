@@ -1,53 +1,123 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import bisect
+import hashlib
 import os
-import subprocess
-import yaml
 import threading
-import datetime
+import json
 import time
-from ttkthemes import ThemedTk
-from .collector import ResourceCollector
-from .visualizer import ResourceVisualizer
-from .reporter import ReportGenerator, ExcelReportGenerator
-from .client import KubernetesClient
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from .visualizer import DEFAULT_NODE_SHAPES
+
+# The kubernetes client, collector, reporters, yaml and subprocess are imported by the
+# handlers that use them, so the window can be drawn before they are loaded.
+
+# Namespaces per kube-context, shown at startup while a fresh list is fetched in the background
+NAMESPACE_CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "k8s-visualizer", "namespaces.json")
+
+# Seconds a collected summary is reused across visualization and report handlers
+SUMMARY_CACHE_TTL = 30
+
+# Most selections whose summaries are kept at once; the least recently used is evicted first
+SUMMARY_CACHE_SIZE = 8
+
+# Handler tasks run at once; further clicks queue behind them instead of each starting a thread
+BACKGROUND_WORKERS = 6
+
+# Status log lines kept before the oldest are dropped
+STATUS_LOG_MAX_LINES = 500
+
+# Check marks drawn in the namespace tree
+CHECKED = "\u2611"
+UNCHECKED = "\u2610"
+
+def _open_in_default_app(path):
+    """Open a file with the platform's default application without waiting for it.
+    
+    Args:
+        path (str): File to open.
+    """
+    if os.name == "nt":
+        os.startfile(path)
+    else:
+        import subprocess
+        # Popen returns as soon as xdg-open is started, so the GUI never waits on the viewer
+        subprocess.Popen(["xdg-open", path])
 
 class K8sVisualizerGUI:
     """GUI for generating Kubernetes visualizations and reports."""
     
-    def __init__(self, root):
-        """Initialize the GUI."""
+    def __init__(self, root, max_workers=BACKGROUND_WORKERS, collector_workers=None):
+        """Initialize the GUI.
+        
+        Args:
+            root (tk.Tk): Root window.
+            max_workers (int): Most handler tasks (collection, rendering, exports) run at once.
+            collector_workers (int, optional): Most concurrent API requests per collection.
+                Defaults to None (ResourceCollector.MAX_WORKERS).
+        """
         self.root = root
         self.root.title("Kubernetes Architecture Visualizer")
         self.root.geometry("850x1000")  # Increased size for new elements
         
         # Initialize components
+        self.client = None
+        self._client_lock = threading.Lock()
+        self.collector_workers = collector_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="k8s-visualizer")
+        self._futures = set()
+        self._closed = False
         self.collector = None
         self.visualizer = None
         self.reporter = None
         self.excel_reporter = None
-        self.namespace_vars = {}
-        self.database_namespace_vars = {}
+        self._summary_cache = {}
+        self._render_cache = {}
+        self.namespace_checked = {}
+        self._selected_set = set()
+        self.database_checked = {}
+        self._database_set = set()
+        self._resource_selected_count = 0
         self.resource_vars = {}
         self.namespaces = []
+        self._namespaces_fetched = False
+        self.ns_tree = None
+        self.ns_loading = None
+        self._tooltip = None
+        self._tooltip_label = None
+        self._writable_dirs = set()
+        self._namespace_watch_started = False
+        self._namespace_events = []
+        self._namespace_events_lock = threading.Lock()
+        self._batch_depth = 0
+        self._refresh_pending = False
+        self._timestamp_cache = (0, "")
+        self._color_namespaces_shown = None
         
         # Available shapes, colors, and resources
-        self.node_shapes = ["box", "box3d", "ellipse", "circle", "tab", "component", "cylinder", "folder"]
+        self.node_shapes = ("box", "box3d", "ellipse", "circle", "tab", "component", "cylinder", "folder")
         self.color_options = {
             "Light Blue": "#B3E5FC", "Light Green": "#C8E6C9", "Light Red": "#FFCDD2",
             "Light Yellow": "#FFECB3", "Light Purple": "#D1C4E9", "Light Cyan": "#B2DFDB",
             "Light Lime": "#F0F4C3", "Light Orange": "#FFCCBC", "Light Gray": "#E6F3FF"
         }
+        self._color_option_keys = tuple(self.color_options)
         self.resource_types = ["Deployment", "StatefulSet", "Service", "PVC", "Ingress", "Pod", "Secret"]
         
         # GUI elements
         self.shape_vars = {}
         self.color_vars = {}
         self.selected_colors = {}
+        self._selected_hex = {}
         self.color_frame = None
+        self._color_row_pool = []
+        self._color_update_pending = None
         self.select_all_var = tk.IntVar()
         self.select_all_db_var = tk.IntVar()
         self.select_all_resources_var = tk.IntVar()
+        self.bundle_yaml_var = tk.IntVar()
+        self.aggregate_yaml_var = tk.IntVar()
         self.generate_button = None
         self.progress = None
         self.status_text = None
@@ -55,9 +125,13 @@ class K8sVisualizerGUI:
         
         # Create GUI elements
         self.create_widgets()
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
     
     def create_widgets(self):
         """Create GUI elements."""
+        # Keep the window unmapped while it is built so Tk lays it out once
+        self.root.withdraw()
+        
         # Main canvas for scrolling the entire window
         main_canvas = tk.Canvas(self.root, highlightthickness=0)
         main_scrollbar = ttk.Scrollbar(self.root, orient=tk.VERTICAL, command=main_canvas.yview)
@@ -74,9 +148,7 @@ class K8sVisualizerGUI:
             main_canvas.itemconfig(main_canvas_frame, width=main_canvas.winfo_width())
         
         main_frame.bind("<Configure>", configure_main_canvas)
-        main_canvas.bind_all("<MouseWheel>", lambda event: main_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units"))
-        main_canvas.bind_all("<Button-4>", lambda event: main_canvas.yview_scroll(-1, "units"))
-        main_canvas.bind_all("<Button-5>", lambda event: main_canvas.yview_scroll(1, "units"))
+        self._main_canvas = main_canvas
         
         # Namespace selection
         tk.Label(main_frame, text="Select Namespaces:", font=("Helvetica", 10, "bold")).grid(row=0, column=0, sticky="w", pady=5)
@@ -85,88 +157,36 @@ class K8sVisualizerGUI:
         namespace_frame.grid(row=1, column=0, sticky="nsew", pady=(0, 10))
         main_frame.grid_rowconfigure(1, weight=0)
         
-        canvas = tk.Canvas(namespace_frame, height=120, highlightthickness=0)
-        scrollbar = ttk.Scrollbar(namespace_frame, orient=tk.VERTICAL, command=canvas.yview)
-        self.namespace_inner_frame = ttk.Frame(canvas)
+        # Add Select All checkboxes
+        select_all_frame = ttk.Frame(namespace_frame)
+        select_all_frame.pack(side=tk.TOP, fill=tk.X)
+        ttk.Checkbutton(select_all_frame, text="Select All Namespaces", variable=self.select_all_var, command=self.toggle_select_all).pack(side=tk.LEFT, pady=2)
+        ttk.Checkbutton(select_all_frame, text="Select All Database Namespaces", variable=self.select_all_db_var, command=self.toggle_select_all_db).pack(side=tk.LEFT, padx=20, pady=2)
         
-        canvas.configure(yscrollcommand=scrollbar.set)
-        canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # Treeview only draws the visible rows, so long namespace lists stay cheap to build and scroll
+        self.ns_tree = ttk.Treeview(namespace_frame, columns=("check", "db"), show="tree headings", height=6, selectmode="none")
+        self.ns_tree.heading("#0", text="Namespace", anchor="w")
+        self.ns_tree.heading("check", text="Selected")
+        self.ns_tree.heading("db", text="Database Namespace")
+        self.ns_tree.column("#0", stretch=True)
+        self.ns_tree.column("check", width=80, anchor="center", stretch=False)
+        self.ns_tree.column("db", width=140, anchor="center", stretch=False)
+        self.ns_tree.tag_configure("db", background="#E6FFE6")
+        # Shown until the first namespace list arrives
+        self.ns_loading = ttk.Progressbar(namespace_frame, mode="indeterminate")
+        self.ns_loading.pack(side=tk.BOTTOM, fill=tk.X, pady=(2, 0))
+        self.ns_loading.start(10)
+        scrollbar = ttk.Scrollbar(namespace_frame, orient=tk.VERTICAL, command=self.ns_tree.yview)
+        self.ns_tree.configure(yscrollcommand=scrollbar.set)
+        self.ns_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.ns_tree.bind("<Button-1>", self.on_namespace_click)
+        self.ns_tree.bind("<space>", self.on_namespace_key)
+        self.create_tooltip(self.ns_tree, "Click the Database Namespace column to mark a namespace for special visualization/reporting")
         
-        canvas_frame = canvas.create_window((0, 0), window=self.namespace_inner_frame, anchor="nw")
-        
-        def configure_canvas(event):
-            canvas.configure(scrollregion=canvas.bbox("all"))
-            canvas.itemconfig(canvas_frame, width=canvas.winfo_width())
-        
-        def on_mouse_wheel(event):
-            if event.num == 4:
-                canvas.yview_scroll(-1, "units")
-            elif event.num == 5:
-                canvas.yview_scroll(1, "units")
-            else:
-                canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        
-        self.namespace_inner_frame.bind("<Configure>", configure_canvas)
-        canvas.bind_all("<MouseWheel>", on_mouse_wheel)
-        canvas.bind_all("<Button-4>", on_mouse_wheel)
-        canvas.bind_all("<Button-5>", on_mouse_wheel)
-        
-        # Fetch namespaces
-        try:
-            client = KubernetesClient()
-            self.namespaces = client.list_namespaces()
-            if not self.namespaces:
-                messagebox.showwarning("Warning", "No namespaces found in the cluster.")
-                self.namespaces = ["default"]
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to fetch namespaces: {str(e)}")
-            self.namespaces = ["default"]
-        
-        # Add Select All checkboxes
-        ttk.Checkbutton(self.namespace_inner_frame, text="Select All Namespaces", variable=self.select_all_var, command=self.toggle_select_all).grid(row=0, column=0, columnspan=2, sticky="w", pady=2)
-        ttk.Checkbutton(self.namespace_inner_frame, text="Select All Database Namespaces", variable=self.select_all_db_var, command=self.toggle_select_all_db).grid(row=0, column=2, sticky="w", pady=2)
-        
-        # Add headers
-        ttk.Label(self.namespace_inner_frame, text="Namespace").grid(row=1, column=0, sticky="w", pady=2)
-        ttk.Label(self.namespace_inner_frame, text="Database Namespace").grid(row=1, column=2, sticky="w", pady=2)
-        
-        # Add tooltips
-        def create_tooltip(widget, text):
-            tooltip = tk.Toplevel(widget)
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry("+1000+1000")
-            label = tk.Label(tooltip, text=text, background="yellow", relief="solid", borderwidth=1)
-            label.pack()
-            
-            def show_tooltip(event):
-                tooltip.wm_geometry(f"+{event.x_root + 10}+{event.y_root + 10}")
-                tooltip.deiconify()
-            
-            def hide_tooltip(event):
-                tooltip.withdraw()
-            
-            widget.bind("<Enter>", show_tooltip)
-            widget.bind("<Leave>", hide_tooltip)
-        
-        # Populate namespace checkboxes
-        for idx, ns in enumerate(sorted(self.namespaces)):
-            var = tk.IntVar()
-            self.namespace_vars[ns] = var
-            chk = ttk.Checkbutton(self.namespace_inner_frame, text=ns, variable=var, command=self.validate_and_update)
-            chk.grid(row=idx + 2, column=0, sticky="w", pady=2)
-            
-            db_var = tk.IntVar()
-            self.database_namespace_vars[ns] = db_var
-            db_chk = ttk.Checkbutton(self.namespace_inner_frame, text="", variable=db_var, command=self.validate_and_update)
-            db_chk.grid(row=idx + 2, column=2, sticky="w", pady=2)
-            db_chk.configure(style="DB.TCheckbutton")
-            
-            create_tooltip(db_chk, "Mark as a database namespace for special visualization/reporting")
-        
-        # Configure custom style for database checkboxes
-        style = ttk.Style()
-        style.configure("DB.TCheckbutton", background="#E6FFE6")
+        # Namespace rows are filled in by a worker from the cache, then from the cluster if needed
+        self.populate_namespace_tree()
+        self._submit(self._load_namespaces)
         
         # Separator
         ttk.Separator(main_frame, orient='horizontal').grid(row=2, column=0, sticky="ew", pady=10)
@@ -183,7 +203,8 @@ class K8sVisualizerGUI:
         for idx, resource in enumerate(self.resource_types):
             var = tk.IntVar(value=1)
             self.resource_vars[resource] = var
-            chk = ttk.Checkbutton(resource_frame, text=resource, variable=var, command=self.validate_and_update)
+            self._resource_selected_count += 1
+            chk = ttk.Checkbutton(resource_frame, text=resource, variable=var, command=lambda var=var: self._on_resource_toggle(var))
             chk.grid(row=idx + 1, column=0, sticky="w", pady=2)
         
         # Separator
@@ -196,7 +217,7 @@ class K8sVisualizerGUI:
         
         for idx, resource in enumerate(self.resource_types):
             ttk.Label(shape_frame, text=f"{resource}:").grid(row=idx, column=0, sticky="w")
-            var = tk.StringVar(value=ResourceVisualizer().node_shapes.get(resource, "box"))
+            var = tk.StringVar(value=DEFAULT_NODE_SHAPES.get(resource, "box"))
             self.shape_vars[resource] = var
             ttk.Combobox(shape_frame, textvariable=var, values=self.node_shapes, state="readonly", width=15).grid(row=idx, column=1, sticky="ew")
             shape_frame.grid_columnconfigure(1, weight=1)
@@ -222,18 +243,12 @@ class K8sVisualizerGUI:
             color_canvas.configure(scrollregion=color_canvas.bbox("all"))
             color_canvas.itemconfig(color_canvas_frame, width=color_canvas.winfo_width())
         
-        def on_color_mouse_wheel(event):
-            if event.num == 4:
-                color_canvas.yview_scroll(-1, "units")
-            elif event.num == 5:
-                color_canvas.yview_scroll(1, "units")
-            else:
-                color_canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
-        
         self.color_frame.bind("<Configure>", configure_color_canvas)
-        color_canvas.bind_all("<MouseWheel>", on_color_mouse_wheel)
-        color_canvas.bind_all("<Button-4>", on_color_mouse_wheel)
-        color_canvas.bind_all("<Button-5>", on_color_mouse_wheel)
+        self._color_canvas = color_canvas
+        
+        # One wheel handler for both canvases, routed by the widget under the pointer
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            self.root.bind_all(sequence, self._on_wheel)
         
         # File entries with browse buttons
         file_frame = ttk.Frame(main_frame)
@@ -262,6 +277,8 @@ class K8sVisualizerGUI:
         self.yaml_export_entry.insert(0, "k8s_yaml_export")
         self.yaml_export_entry.grid(row=3, column=1, sticky="ew", pady=2)
         ttk.Button(file_frame, text="Browse", command=self.browse_yaml_dir).grid(row=3, column=2, padx=5, pady=2)
+        ttk.Checkbutton(file_frame, text="Bundle YAML export as manifests.tar.gz", variable=self.bundle_yaml_var).grid(row=4, column=1, sticky="w", pady=2)
+        ttk.Checkbutton(file_frame, text="Export one multi-document YAML file per namespace", variable=self.aggregate_yaml_var).grid(row=5, column=1, sticky="w", pady=2)
         
         file_frame.grid_columnconfigure(1, weight=1)
         
@@ -284,7 +301,8 @@ class K8sVisualizerGUI:
         ttk.Button(button_frame, text="Open SVG", command=self.open_svg).grid(row=1, column=0, padx=3, pady=2, sticky="ew")
         ttk.Button(button_frame, text="Open CSV", command=self.open_csv).grid(row=1, column=1, padx=3, pady=2, sticky="ew")
         ttk.Button(button_frame, text="Open Excel", command=self.open_excel).grid(row=1, column=2, padx=3, pady=2, sticky="ew")
-        ttk.Button(button_frame, text="Clear Selections", command=self.clear_selections).grid(row=2, column=0, columnspan=4, padx=3, pady=2, sticky="ew")
+        ttk.Button(button_frame, text="Refresh from Cluster", command=self.refresh_from_cluster).grid(row=2, column=0, columnspan=2, padx=3, pady=2, sticky="ew")
+        ttk.Button(button_frame, text="Clear Selections", command=self.clear_selections).grid(row=2, column=2, columnspan=2, padx=3, pady=2, sticky="ew")
         button_frame.grid_columnconfigure((0, 1, 2, 3), weight=1)
         
         # Status log
@@ -300,12 +318,301 @@ class K8sVisualizerGUI:
         
         self.validate_and_update()
         self.log_status("Ready")
+        self.root.update_idletasks()
+        self.root.deiconify()
+    
+    def _load_namespaces(self):
+        """Show cached namespaces, then fetch the current list from the cluster.
+        
+        With a cached list, the namespace watch is started right away; the full list it
+        reports first replaces the cached one, so no separate fetch is needed.
+        """
+        cached_namespaces = self._load_namespaces_cached()
+        if cached_namespaces:
+            self._post(self._apply_namespaces, cached_namespaces)
+            self._post(self._start_namespace_watch)
+        else:
+            self._refresh_namespaces()
+    
+    def _load_namespaces_cached(self):
+        """Read the cached namespace list of the current kube-context.
+        
+        Returns:
+            list: Cached namespaces, or None if nothing is cached.
+        """
+        from .client import current_context
+        try:
+            with open(NAMESPACE_CACHE_FILE) as f:
+                entry = json.load(f).get(current_context() or "")
+        except (OSError, ValueError):
+            return None
+        return entry["namespaces"] if entry else None
+    
+    def _save_namespaces_cache(self, namespaces):
+        """Store the namespace list of the current kube-context in the cache file."""
+        from .client import current_context
+        try:
+            with open(NAMESPACE_CACHE_FILE) as f:
+                cache = json.load(f)
+        except (OSError, ValueError):
+            cache = {}
+        cache[current_context() or ""] = {"fetched_at": time.time(), "namespaces": namespaces}
+        try:
+            os.makedirs(os.path.dirname(NAMESPACE_CACHE_FILE), exist_ok=True)
+            with open(NAMESPACE_CACHE_FILE, "w") as f:
+                json.dump(cache, f)
+        except OSError:
+            pass
+    
+    def _refresh_namespaces(self):
+        """Fetch namespaces from the cluster in a worker thread and update the namespace tree."""
+        try:
+            namespaces = self._get_client().list_namespaces()
+        except Exception as e:
+            self._post(self._finish_refresh_namespaces, [], f"Failed to fetch namespaces: {str(e)}")
+            return
+        if namespaces:
+            self._save_namespaces_cache(namespaces)
+        self._post(self._finish_refresh_namespaces, namespaces)
+    
+    def _get_client(self):
+        """Return the Kubernetes client shared by every handler, creating it on first use.
+        
+        Reusing one client keeps its kubeconfig, HTTP connection pool and list cache
+        warm across clicks instead of reconnecting for every collector.
+        """
+        with self._client_lock:
+            if self.client is None:
+                from .client import KubernetesClient
+                self.client = KubernetesClient()
+            return self.client
+    
+    def _finish_refresh_namespaces(self, namespaces, error=None):
+        """Apply a freshly fetched namespace list on the UI thread."""
+        self._hide_namespace_loading()
+        if error:
+            messagebox.showerror("Error", error)
+        elif not namespaces:
+            messagebox.showwarning("Warning", "No namespaces found in the cluster.")
+        fetched = bool(namespaces)
+        if not fetched:
+            if self.namespaces:
+                return  # Keep the cached list rather than replacing it with a placeholder
+            namespaces = ["default"]
+        if self._apply_namespaces(namespaces, fetched=fetched):
+            self.log_status(f"Namespaces refreshed: {len(namespaces)} found")
+        if fetched:
+            # From now on only namespace additions and deletions are transferred
+            self._start_namespace_watch()
+    
+    def _start_namespace_watch(self):
+        """Start the namespace watch on the UI thread, once per session."""
+        if self._namespace_watch_started:
+            return
+        self._namespace_watch_started = True
+        # The watch only returns when access is denied, so it gets its own thread instead of holding a pool worker
+        threading.Thread(target=self._watch_namespaces, daemon=True).start()
+    
+    def _watch_namespaces(self):
+        """Forward namespace watch events from a worker thread to the UI thread."""
+        self._get_client().watch_namespaces(self._queue_namespace_event)
+    
+    def _queue_namespace_event(self, event_type, data):
+        """Queue a watch event from the worker thread, scheduling one drain per burst of events."""
+        if event_type == "SYNC" and data:
+            self._save_namespaces_cache(data)
+        with self._namespace_events_lock:
+            self._namespace_events.append((event_type, data))
+            if len(self._namespace_events) > 1:
+                return  # A drain is already scheduled
+        self._post(self._drain_namespace_events)
+    
+    def _drain_namespace_events(self):
+        """Apply all queued watch events on the UI thread, refreshing dependent widgets once."""
+        with self._namespace_events_lock:
+            events, self._namespace_events = self._namespace_events, []
+        with self.batch_updates():
+            for event_type, data in events:
+                self._patch_namespace_rows(event_type, data)
+    
+    def _patch_namespace_rows(self, event_type, data):
+        """Apply a namespace watch event to the tree on the UI thread.
+        
+        Args:
+            event_type (str): "SYNC" with the full name list, or "ADDED"/"DELETED" with one name.
+            data: Name list for "SYNC", otherwise the namespace name.
+        """
+        if event_type == "SYNC":
+            if data and self._apply_namespaces(data):
+                self.log_status(f"Namespaces refreshed: {len(data)} found")
+            return
+        ns = data
+        if event_type == "ADDED" and ns not in self.namespace_checked:
+            self.namespaces = self.namespaces + [ns]
+            self.namespace_checked[ns] = False
+            self.database_checked[ns] = False
+            # Rows are kept sorted by name
+            index = bisect.bisect(self.ns_tree.get_children(), ns)
+            self.ns_tree.insert("", index, iid=ns, text=ns)
+            self.update_namespace_row(ns)
+        elif event_type == "DELETED" and ns in self.namespace_checked:
+            self._set_namespace_checked(ns, False)
+            self.namespaces = [name for name in self.namespaces if name != ns]
+            del self.namespace_checked[ns]
+            del self.database_checked[ns]
+            self.ns_tree.delete(ns)
+        else:
+            return
+        self.log_status(f"Namespace {ns} {event_type.lower()}")
+        self.validate_and_update()
+    
+    def _apply_namespaces(self, namespaces, fetched=True):
+        """Show a namespace list in the tree on the UI thread.
+        
+        Args:
+            namespaces (list): Namespace names.
+            fetched (bool): Whether the list came from the cluster (directly or via the cache
+                file) rather than being the "default" placeholder shown when listing failed.
+        
+        Returns:
+            bool: Whether the list differed from the one shown.
+        """
+        self._hide_namespace_loading()
+        self._namespaces_fetched = fetched
+        if sorted(namespaces) == sorted(self.namespaces):
+            return False
+        self.namespaces = namespaces
+        self.populate_namespace_tree()
+        self.validate_and_update()
+        return True
+    
+    def _hide_namespace_loading(self):
+        """Remove the namespace loading indicator."""
+        if self.ns_loading is not None:
+            self.ns_loading.stop()
+            self.ns_loading.pack_forget()
+            self.ns_loading = None
+    
+    def populate_namespace_tree(self):
+        """Insert one tree row per namespace, keeping existing selections."""
+        self.ns_tree.delete(*self.ns_tree.get_children())
+        self.namespace_checked = {ns: self.namespace_checked.get(ns, False) for ns in sorted(self.namespaces)}
+        self.database_checked = {ns: self.database_checked.get(ns, False) for ns in self.namespace_checked}
+        self._selected_set &= self.namespace_checked.keys()
+        self._database_set &= self.namespace_checked.keys()
+        for ns in self.namespace_checked:
+            self.ns_tree.insert("", "end", iid=ns, text=ns)
+            self.update_namespace_row(ns)
+    
+    def update_namespace_row(self, ns):
+        """Redraw the check marks and database highlight of a namespace row."""
+        checked = self.namespace_checked[ns]
+        db_checked = self.database_checked[ns]
+        self.ns_tree.item(
+            ns,
+            values=(CHECKED if checked else UNCHECKED, CHECKED if db_checked else UNCHECKED),
+            tags=("db",) if db_checked else (),
+        )
+    
+    def toggle_namespace(self, ns, column):
+        """Flip the namespace or database check of a row."""
+        if column == "#2":
+            # Only selected namespaces can be marked as database namespaces
+            if ns in self._selected_set:
+                self._set_database_checked(ns, not self.database_checked[ns])
+        else:
+            self._set_namespace_checked(ns, not self.namespace_checked[ns])
+        self.update_namespace_row(ns)
+        self.validate_and_update()
+    
+    def _set_namespace_checked(self, ns, checked):
+        """Record a namespace selection, keeping the selected set in step with the rows."""
+        self.namespace_checked[ns] = checked
+        if checked:
+            self._selected_set.add(ns)
+        else:
+            self._selected_set.discard(ns)
+            self._set_database_checked(ns, False)
+    
+    def _set_database_checked(self, ns, checked):
+        """Record a database mark, keeping the database set in step with the rows."""
+        self.database_checked[ns] = checked
+        if checked:
+            self._database_set.add(ns)
+        else:
+            self._database_set.discard(ns)
+    
+    def on_namespace_click(self, event):
+        """Toggle the check under the pointer; the Database Namespace column toggles the database mark."""
+        if self.ns_tree.identify_region(event.x, event.y) not in ("cell", "tree"):
+            return
+        ns = self.ns_tree.identify_row(event.y)
+        if ns:
+            self.ns_tree.focus(ns)
+            self.toggle_namespace(ns, self.ns_tree.identify_column(event.x))
+    
+    def on_namespace_key(self, event):
+        """Toggle the focused namespace with the space bar."""
+        ns = self.ns_tree.focus()
+        if ns:
+            self.toggle_namespace(ns, "#1")
+    
+    def _on_wheel(self, event):
+        """Scroll the color canvas when the pointer is over it, otherwise the main canvas."""
+        widget = self.root.winfo_containing(event.x_root, event.y_root)
+        if widget is None or widget is self.ns_tree:
+            # The namespace tree scrolls itself
+            return
+        if event.num == 4:
+            units = -1
+        elif event.num == 5:
+            units = 1
+        else:
+            units = int(-1 * (event.delta / 120))
+        canvas = self._main_canvas
+        while widget is not None:
+            if widget is self._color_canvas:
+                canvas = widget
+                break
+            widget = widget.master
+        canvas.yview_scroll(units, "units")
+    
+    def create_tooltip(self, widget, text):
+        """Show a tooltip next to the pointer while it hovers over a widget.
+        
+        All widgets share one hidden tooltip window, retexted when it is shown.
+        """
+        if self._tooltip is None:
+            self._tooltip = tk.Toplevel(self.root)
+            self._tooltip.wm_overrideredirect(True)
+            self._tooltip.withdraw()
+            self._tooltip_label = tk.Label(self._tooltip, background="yellow", relief="solid", borderwidth=1)
+            self._tooltip_label.pack()
+        
+        def show_tooltip(event):
+            self._tooltip_label.config(text=text)
+            self._tooltip.wm_geometry(f"+{event.x_root + 10}+{event.y_root + 10}")
+            self._tooltip.deiconify()
+        
+        def hide_tooltip(event):
+            self._tooltip.withdraw()
+        
+        widget.bind("<Enter>", show_tooltip)
+        widget.bind("<Leave>", hide_tooltip)
     
     def log_status(self, message):
         """Log a status message with timestamp."""
         self.status_text.configure(state="normal")
-        timestamp = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        # Timestamps have one-second resolution, so format each second only once
+        now = int(time.time())
+        if self._timestamp_cache[0] != now:
+            self._timestamp_cache = (now, time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now)))
+        timestamp = self._timestamp_cache[1]
         self.status_text.insert(tk.END, f"[{timestamp}] {message}\n")
+        # The text ends with a newline, so the line count is one more than the messages
+        overflow = int(self.status_text.index("end-1c").split(".")[0]) - 1 - STATUS_LOG_MAX_LINES
+        if overflow > 0:
+            self.status_text.delete("1.0", f"{overflow + 1}.0")
         self.status_text.see(tk.END)
         self.status_text.configure(state="disabled")
     
@@ -350,18 +657,19 @@ class K8sVisualizerGUI:
             self.yaml_export_entry.insert(0, directory)
     
     def toggle_select_all(self):
-        """Toggle all namespace checkboxes based on Select All state."""
-        select_all = self.select_all_var.get()
-        for var in self.namespace_vars.values():
-            var.set(select_all)
+        """Toggle all namespace rows based on Select All state."""
+        select_all = bool(self.select_all_var.get())
+        for ns in self.namespace_checked:
+            self._set_namespace_checked(ns, select_all)
+            self.update_namespace_row(ns)
         self.validate_and_update()
     
     def toggle_select_all_db(self):
-        """Toggle all database namespace checkboxes based on Select All Database state."""
-        select_all_db = self.select_all_db_var.get()
-        for ns, db_var in self.database_namespace_vars.items():
-            if self.namespace_vars[ns].get():
-                db_var.set(select_all_db)
+        """Toggle all database namespace marks based on Select All Database state."""
+        select_all_db = bool(self.select_all_db_var.get())
+        for ns in self._selected_set:
+            self._set_database_checked(ns, select_all_db)
+            self.update_namespace_row(ns)
         self.validate_and_update()
     
     def toggle_select_all_resources(self):
@@ -369,16 +677,22 @@ class K8sVisualizerGUI:
         select_all = self.select_all_resources_var.get()
         for var in self.resource_vars.values():
             var.set(select_all)
+        self._resource_selected_count = len(self.resource_vars) if select_all else 0
+        self.validate_and_update()
+    
+    def _on_resource_toggle(self, var):
+        """Count a resource checkbox change, then refresh the dependent widgets."""
+        self._resource_selected_count += 1 if var.get() else -1
         self.validate_and_update()
     
     def clear_selections(self):
         """Clear all selections to default state."""
-        for var in self.namespace_vars.values():
-            var.set(0)
-        for var in self.database_namespace_vars.values():
-            var.set(0)
+        for ns in self.namespace_checked:
+            self._set_namespace_checked(ns, False)
+            self.update_namespace_row(ns)
         for var in self.resource_vars.values():
             var.set(1)  # Default to all resources selected
+        self._resource_selected_count = len(self.resource_vars)
         self.select_all_var.set(0)
         self.select_all_db_var.set(0)
         self.select_all_resources_var.set(1)
@@ -390,75 +704,203 @@ class K8sVisualizerGUI:
         self.excel_entry.insert(0, "k8s_components_report.xlsx")
         self.yaml_export_entry.delete(0, tk.END)
         self.yaml_export_entry.insert(0, "k8s_yaml_export")
+        self.bundle_yaml_var.set(0)
+        self.aggregate_yaml_var.set(0)
         self.validate_and_update()
         self.log_status("All selections cleared to default")
     
+    @contextmanager
+    def batch_updates(self):
+        """Defer validate_and_update calls made inside the block to one run once the UI is idle.
+        
+        Blocks may be nested; the deferred update is scheduled when the outermost one exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._refresh_pending:
+                self._refresh_pending = False
+                self.root.after_idle(self.validate_and_update)
+    
     def validate_and_update(self):
         """Validate namespace, database namespace, and resource selections and update UI."""
-        selected_namespaces = [ns for ns, var in self.namespace_vars.items() if var.get()]
-        for ns, db_var in self.database_namespace_vars.items():
-            if not self.namespace_vars[ns].get() and db_var.get():
-                db_var.set(0)
+        if self._batch_depth:
+            self._refresh_pending = True
+            return
         
-        if all(var.get() for var in self.namespace_vars.values()):
+        # Database marks are a subset of the selection, so set sizes and counters suffice
+        if len(self._selected_set) == len(self.namespace_checked):
             self.select_all_var.set(1)
-        elif not any(var.get() for var in self.namespace_vars.values()):
-            self.select_all_var.set(0)
         else:
             self.select_all_var.set(0)
         
-        if selected_namespaces and all(self.database_namespace_vars[ns].get() for ns in selected_namespaces):
+        if self._selected_set and len(self._database_set) == len(self._selected_set):
             self.select_all_db_var.set(1)
-        elif not any(var.get() for var in self.database_namespace_vars.values()):
-            self.select_all_db_var.set(0)
         else:
             self.select_all_db_var.set(0)
         
-        if all(var.get() for var in self.resource_vars.values()):
+        if self._resource_selected_count == len(self.resource_vars):
             self.select_all_resources_var.set(1)
-        elif not any(var.get() for var in self.resource_vars.values()):
-            self.select_all_resources_var.set(0)
         else:
             self.select_all_resources_var.set(0)
         
-        self.update_color_options()
+        self._schedule_color_update()
         self.update_selection_count()
     
+    def _schedule_color_update(self):
+        """Coalesce color section updates from rapid or bulk toggles into one, 50 ms after the last."""
+        if self._color_update_pending is not None:
+            self.root.after_cancel(self._color_update_pending)
+        self._color_update_pending = self.root.after(50, self._do_color_update)
+    
+    def _do_color_update(self):
+        """Run the scheduled color section update."""
+        self._color_update_pending = None
+        self.update_color_options()
+    
+    def _flush_color_update(self):
+        """Apply a pending color section update right away, before colors are read."""
+        if self._color_update_pending is not None:
+            self.root.after_cancel(self._color_update_pending)
+            self._do_color_update()
+    
     def update_color_options(self):
         """Update Namespace Colors section based on selected namespaces."""
-        selected_namespaces = [ns for ns, var in self.namespace_vars.items() if var.get()]
+        selected_namespaces = sorted(self._selected_set)
         if not selected_namespaces:
             selected_namespaces = [self.namespaces[0]] if self.namespaces else []
         
         selected_namespaces = sorted(selected_namespaces)
         
-        for widget in self.color_frame.winfo_children():
-            widget.destroy()
-        self.color_vars.clear()
+        # Database marks and resource toggles leave the rows as they are
+        shown = frozenset(selected_namespaces)
+        if shown == self._color_namespaces_shown:
+            return
+        self._color_namespaces_shown = shown
         
+        # Reuse pooled rows instead of destroying and recreating every widget
+        self.color_vars.clear()
         for idx, ns in enumerate(selected_namespaces):
-            ttk.Label(self.color_frame, text=f"{ns}:").grid(row=idx, column=0, sticky="w")
-            previous_color = self.selected_colors.get(ns, "Light Gray")
-            var = tk.StringVar(value=previous_color)
-            self.color_vars[ns] = var
-            combobox = ttk.Combobox(self.color_frame, textvariable=var, values=list(self.color_options.keys()), state="readonly", width=15)
-            combobox.grid(row=idx, column=1, sticky="ew")
-            combobox.bind("<<ComboboxSelected>>", lambda event, namespace=ns: self.update_selected_color(namespace, self.color_vars[namespace].get()))
-            self.color_frame.grid_columnconfigure(1, weight=1)
+            if idx < len(self._color_row_pool):
+                row = self._color_row_pool[idx]
+                row["label"].config(text=f"{ns}:")
+                row["label"].grid()
+                row["combobox"].grid()
+            else:
+                var = tk.StringVar()
+                label = ttk.Label(self.color_frame, text=f"{ns}:")
+                label.grid(row=idx, column=0, sticky="w")
+                combobox = ttk.Combobox(self.color_frame, textvariable=var, values=self._color_option_keys, state="readonly", width=15)
+                combobox.grid(row=idx, column=1, sticky="ew")
+                combobox.bind("<<ComboboxSelected>>", self._on_color_selected)
+                row = {"label": label, "combobox": combobox, "var": var}
+                self._color_row_pool.append(row)
+            # Read by the shared <<ComboboxSelected>> handler
+            row["combobox"]._ns = ns
+            row["var"].set(self.selected_colors.get(ns, "Light Gray"))
+            self.color_vars[ns] = row["var"]
+        self.color_frame.grid_columnconfigure(1, weight=1)
+        
+        for row in self._color_row_pool[len(selected_namespaces):]:
+            row["label"].grid_remove()
+            row["combobox"].grid_remove()
     
     def update_selected_color(self, namespace, color):
         """Update the persistently stored color for a namespace."""
         self.selected_colors[namespace] = color
+        self._selected_hex[namespace] = self.color_options[color]
+    
+    def _on_color_selected(self, event):
+        """Store the color picked in a namespace color combobox."""
+        combobox = event.widget
+        self.update_selected_color(combobox._ns, combobox.get())
     
     def update_selection_count(self):
         """Update the selection count display."""
-        selected_namespaces = len([ns for ns, var in self.namespace_vars.items() if var.get()])
-        selected_resources = len([res for res, var in self.resource_vars.items() if var.get()])
+        selected_namespaces = len(self._selected_set)
+        selected_resources = self._resource_selected_count
         self.selection_count_label.config(text=f"Selected: {selected_namespaces} namespaces, {selected_resources} resources")
     
+    def _summary_key(self, selected_namespaces, selected_database_namespaces):
+        """Return the summary cache key of a selection in the current 30 s window."""
+        bucket = int(time.time() // SUMMARY_CACHE_TTL)
+        return (frozenset(selected_namespaces), frozenset(selected_database_namespaces), bucket)
+    
+    def _new_collector(self, selected_namespaces, selected_database_namespaces):
+        """Create a collector for a selection, sharing the GUI's Kubernetes client.
+        
+        Once more than half of the known namespaces are selected, one cluster-wide list
+        per kind filtered client-side is cheaper than one list per namespace and kind.
+        That is only judged against a namespace list fetched from the cluster: when listing
+        namespaces failed, the user most likely lacks cluster-scoped rights altogether.
+        """
+        from .collector import ResourceCollector
+        all_namespaces = (
+            self._namespaces_fetched
+            and len(selected_namespaces) > 1
+            and len(selected_namespaces) > len(self.namespaces) // 2
+        )
+        return ResourceCollector(selected_namespaces, selected_database_namespaces, max_workers=self.collector_workers, all_namespaces=all_namespaces, client=self._get_client())
+    
+    def _get_summary(self, selected_namespaces, selected_database_namespaces):
+        """Return collect_summary() for a selection, reusing a result collected in the same 30 s window.
+        
+        Args:
+            selected_namespaces (list): Namespaces to collect from.
+            selected_database_namespaces (list): Namespaces whose deployments are skipped.
+        
+        Progress is shown as each resource kind arrives, rather than only once all are collected.
+        
+        Returns:
+            tuple: Summary lists as returned by ResourceCollector.collect_summary.
+        """
+        key = self._summary_key(selected_namespaces, selected_database_namespaces)
+        bucket = key[2]
+        summary = self._summary_cache.pop(key, None)
+        if summary is not None:
+            # Moved to the end, so eviction drops the least recently used selection
+            self._summary_cache[key] = summary
+        else:
+            self.collector = self._new_collector(selected_namespaces, selected_database_namespaces)
+            summaries = {}
+            for kind, objects in self.collector.iter_summary_lists():
+                summaries[kind] = objects
+                self._post(self._show_collect_progress, kind, len(objects), len(summaries))
+            summary = tuple(summaries[kind] for kind in self.collector.RESOURCE_KINDS)
+            # Entries from earlier windows can never be hit again
+            cache = {k: v for k, v in self._summary_cache.items() if k[2] == bucket}
+            while len(cache) >= SUMMARY_CACHE_SIZE:
+                # Evict the least recently used selection, dicts keep insertion order
+                del cache[next(iter(cache))]
+            cache[key] = summary
+            self._summary_cache = cache
+        return summary
+    
+    def _show_collect_progress(self, kind, count, collected):
+        """Log a collected resource kind and advance the progress bar on the UI thread.
+        
+        Args:
+            kind (str): Resource kind that was collected.
+            count (int): Number of resources of that kind.
+            collected (int): Number of kinds collected so far.
+        """
+        self.progress.stop()
+        self.progress["value"] = 100 * collected // len(self.resource_types)
+        self.log_status(f"Collected {count} {kind}")
+    
+    def refresh_from_cluster(self):
+        """Drop cached summaries and reload the namespace list."""
+        self._summary_cache = {}
+        if self.client is not None:
+            self.client.invalidate()
+        self._submit(self._refresh_namespaces)
+        self.log_status("Refreshing from cluster")
+    
     def check_namespaces_selected(self):
         """Check if namespaces are selected and show warning if not."""
-        selected_namespaces = [ns for ns, var in self.namespace_vars.items() if var.get()]
+        selected_namespaces = sorted(self._selected_set)
         if not selected_namespaces:
             messagebox.showwarning("Warning", "Please select at least one namespace.")
         return selected_namespaces
@@ -476,20 +918,21 @@ class K8sVisualizerGUI:
             return False
         if not file_path.lower().endswith(extension):
             file_path += extension
-        try:
-            directory = os.path.dirname(file_path) or "."
-            if not os.path.exists(directory):
-                os.makedirs(directory)
-            with open(file_path, "w") as f:
-                pass  # Test write access
-            os.remove(file_path) if os.path.exists(file_path) else None
-            return True
-        except Exception:
-            return False
+        # Probe permissions instead of truncating an existing file to test write access
+        directory = os.path.dirname(file_path) or "."
+        if directory not in self._writable_dirs:
+            try:
+                os.makedirs(directory, exist_ok=True)
+            except OSError:
+                return False
+            if not os.access(directory, os.W_OK):
+                return False
+            self._writable_dirs.add(directory)
+        return not os.path.exists(file_path) or os.access(file_path, os.W_OK)
     
     def warn_no_database_namespaces(self, selected_namespaces):
         """Warn if no database namespaces are selected."""
-        selected_database_namespaces = [ns for ns, var in self.database_namespace_vars.items() if var.get()]
+        selected_database_namespaces = sorted(self._database_set)
         if not selected_database_namespaces and selected_namespaces:
             messagebox.showwarning("Warning", "No database namespaces selected. Treating all selected namespaces as normal namespaces.")
         return selected_database_namespaces
@@ -507,6 +950,12 @@ class K8sVisualizerGUI:
             self.log_status("Error: Invalid SVG file path or no write permission")
             return
         
+        selected_database_namespaces = self.warn_no_database_namespaces(selected_namespaces)
+        self._flush_color_update()
+        # Tk variables are read here on the UI thread, not by the worker
+        node_shapes = {resource: var.get() for resource, var in self.shape_vars.items() if resource in selected_resources}
+        default_color = self.color_options["Light Gray"]
+        namespace_colors = {ns: self._selected_hex.get(ns, default_color) for ns in selected_namespaces}
         self.generate_button.config(state="disabled")
         self.log_status("Generating visualization, please wait...")
         self.progress["value"] = 0
@@ -515,16 +964,11 @@ class K8sVisualizerGUI:
         
         def generate_in_thread():
             try:
-                selected_database_namespaces = self.warn_no_database_namespaces(selected_namespaces)
-                
-                node_shapes = {resource: var.get() for resource, var in self.shape_vars.items() if resource in selected_resources}
-                namespace_colors = {ns: self.color_options[var.get()] for ns, var in self.color_vars.items() if ns in selected_namespaces}
-                
-                svg_filename = self.svg_entry.get()
+                svg_filename = svg_file
                 if svg_filename.lower().endswith(".svg"):
                     svg_filename = svg_filename[:-4]
                 
-                self.collector = ResourceCollector(selected_namespaces, selected_database_namespaces)
+                from .visualizer import ResourceVisualizer
                 self.visualizer = ResourceVisualizer(
                     output_file=svg_filename,
                     output_format="svg",
@@ -532,23 +976,87 @@ class K8sVisualizerGUI:
                     namespace_colors=namespace_colors
                 )
                 
-                deployments = [] if "Deployment" not in selected_resources else self.collector.collect_summary()[0]
-                statefulsets = [] if "StatefulSet" not in selected_resources else self.collector.collect_summary()[1]
-                services = [] if "Service" not in selected_resources else self.collector.collect_summary()[2]
-                pvcs = [] if "PVC" not in selected_resources else self.collector.collect_summary()[3]
-                ingresses = [] if "Ingress" not in selected_resources else self.collector.collect_summary()[4]
-                pods = [] if "Pod" not in selected_resources else self.collector.collect_summary()[5]
-                secrets = [] if "Secret" not in selected_resources else self.collector.collect_summary()[6]
+                summary = self._get_summary(selected_namespaces, selected_database_namespaces)
+                deployments, statefulsets, services, pvcs, ingresses, pods, secrets = (
+                    objects if resource in selected_resources else []
+                    for resource, objects in zip(self.resource_types, summary)
+                )
                 
-                self.root.after(0, lambda: self.progress["value"])
+                self._post(lambda: self.progress["value"])
                 self.visualizer.build_diagram(deployments, statefulsets, services, pvcs, ingresses, pods, secrets, selected_namespaces)
-                self.visualizer.render(view=False)
                 
-                self.root.after(0, lambda: self.finish_generate_visualization(f"Visualization generated: {svg_filename}.svg"))
+                # Graphviz layout is the slow part, so it is skipped when the file already holds this exact source
+                svg_path = f"{svg_filename}.svg"
+                digest = hashlib.blake2b(self.visualizer.dot.source.encode("utf-8"), digest_size=16).digest()
+                if self._render_cache.get(svg_path) == (digest, self._mtime_ns(svg_path)):
+                    message = f"Visualization unchanged: {svg_path}"
+                else:
+                    self.visualizer.render(view=False)
+                    self._render_cache[svg_path] = (digest, self._mtime_ns(svg_path))
+                    message = f"Visualization generated: {svg_path}"
+                
+                self._post(lambda: self.finish_generate_visualization(message))
             except Exception as e:
-                self.root.after(0, lambda: self.finish_generate_visualization(f"Error: {str(e)}", error=True))
+                self._post(self.finish_generate_visualization, f"Error: {str(e)}", True)
         
-        threading.Thread(target=generate_in_thread, daemon=True).start()
+        self._submit(generate_in_thread)
+    
+    @staticmethod
+    def _mtime_ns(path):
+        """Return a file's modification time in nanoseconds, or None if it does not exist."""
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+    
+    def _run_in_background(self, description, work, error_prefix):
+        """Run a handler's blocking work on the worker pool and report the outcome on the UI thread.
+        
+        Args:
+            description (str): Status shown while the work runs.
+            work (callable): Does the work and returns the status message to log on success.
+            error_prefix (str): Start of the error dialog text if work raises.
+        """
+        self.log_status(f"{description}, please wait...")
+        self.progress.start(10)
+        
+        def done(future):
+            if future.cancelled():
+                return  # Dropped by close() before it started
+            e = future.exception()
+            if e is not None:
+                self._post(self._finish_background, f"Error: {str(e)}", f"{error_prefix}: {str(e)}")
+                return
+            self._post(self._finish_background, future.result())
+        
+        self._submit(work).add_done_callback(done)
+    
+    def _submit(self, fn):
+        """Run fn on the worker pool, keeping its future so close() can cancel it while queued."""
+        future = self._executor.submit(fn)
+        self._futures.add(future)
+        future.add_done_callback(self._futures.discard)
+        return future
+    
+    def _post(self, callback, *args):
+        """Schedule a callback on the UI thread from a worker thread, unless the window is closed.
+        
+        Workers still running when close() is called finish after the Tk root is destroyed,
+        where root.after raises RuntimeError or TclError, so their results are dropped.
+        """
+        if self._closed:
+            return
+        try:
+            self.root.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):
+            pass
+    
+    def _finish_background(self, message, error=None):
+        """Log the outcome of background work and show its error, if any."""
+        self.progress.stop()
+        self.log_status(message)
+        if error:
+            messagebox.showerror("Error", error)
     
     def finish_generate_visualization(self, message, error=False):
         """Update UI after visualization generation."""
@@ -560,96 +1068,105 @@ class K8sVisualizerGUI:
             messagebox.showerror("Error", message)
     
     def generate_report(self):
-        """Generate the CSV report."""
-        try:
-            selected_namespaces = self.check_namespaces_selected()
-            selected_resources = self.check_resources_selected()
-            if not selected_namespaces or not selected_resources:
-                return
-            
-            csv_file = self.csv_entry.get()
-            if not self.check_file_writable(csv_file, ".csv"):
-                messagebox.showerror("Error", "Invalid CSV file path or no write permission.")
-                self.log_status("Error: Invalid CSV file path or no write permission")
-                return
-            
-            selected_database_namespaces = self.warn_no_database_namespaces(selected_namespaces)
-            
-            self.collector = ResourceCollector(selected_namespaces, selected_database_namespaces)
-            self.reporter = ReportGenerator(output_file=self.csv_entry.get())
-            
-            deployments = [] if "Deployment" not in selected_resources else self.collector.collect_summary()[0]
-            statefulsets = [] if "StatefulSet" not in selected_resources else self.collector.collect_summary()[1]
-            services = [] if "Service" not in selected_resources else self.collector.collect_summary()[2]
-            pvcs = [] if "PVC" not in selected_resources else self.collector.collect_summary()[3]
-            ingresses = [] if "Ingress" not in selected_resources else self.collector.collect_summary()[4]
-            pods = [] if "Pod" not in selected_resources else self.collector.collect_summary()[5]
-            secrets = [] if "Secret" not in selected_resources else self.collector.collect_summary()[6]
+        """Generate the CSV report in a worker thread."""
+        selected_namespaces = self.check_namespaces_selected()
+        selected_resources = self.check_resources_selected()
+        if not selected_namespaces or not selected_resources:
+            return
+        
+        csv_file = self.csv_entry.get()
+        if not self.check_file_writable(csv_file, ".csv"):
+            messagebox.showerror("Error", "Invalid CSV file path or no write permission.")
+            self.log_status("Error: Invalid CSV file path or no write permission")
+            return
+        
+        selected_database_namespaces = self.warn_no_database_namespaces(selected_namespaces)
+        
+        def work():
+            from .collector import ResourceCollector
+            from .reporter import ReportGenerator
+            self.reporter = ReportGenerator(output_file=csv_file)
+            kinds = [kind for kind, resource in zip(ResourceCollector.RESOURCE_KINDS, self.resource_types) if resource in selected_resources]
             
-            self.reporter.generate_report(deployments, statefulsets, services, pvcs, ingresses, pods, secrets, selected_namespaces)
+            # Reuse a summary collected in this window, otherwise write rows while later kinds are fetched
+            summary = self._summary_cache.get(self._summary_key(selected_namespaces, selected_database_namespaces))
+            if summary is None:
+                self.collector = self._new_collector(selected_namespaces, selected_database_namespaces)
+                items = self.collector.iter_summary(kinds)
+            else:
+                items = (
+                    (kind, item)
+                    for kind, objects in zip(ResourceCollector.RESOURCE_KINDS, summary) if kind in kinds
+                    for item in objects
+                )
             
-            self.log_status(f"CSV report generated: {self.csv_entry.get()}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate report: {str(e)}")
-            self.log_status(f"Error: {str(e)}")
+            self.reporter.generate_report_stream(items, selected_namespaces)
+            return f"CSV report generated: {csv_file}"
+        
+        self._run_in_background("Generating CSV report", work, "Failed to generate report")
     
     def generate_excel_report(self):
-        """Generate the Excel report."""
-        try:
-            selected_namespaces = self.check_namespaces_selected()
-            selected_resources = self.check_resources_selected()
-            if not selected_namespaces or not selected_resources:
-                return
-            
-            excel_file = self.excel_entry.get()
-            if not self.check_file_writable(excel_file, ".xlsx"):
-                messagebox.showerror("Error", "Invalid Excel file path or no write permission.")
-                self.log_status("Error: Invalid Excel file path or no write permission")
-                return
-            
-            selected_database_namespaces = self.warn_no_database_namespaces(selected_namespaces)
-            
-            self.collector = ResourceCollector(selected_namespaces, selected_database_namespaces)
-            self.excel_reporter = ExcelReportGenerator(output_file=self.excel_entry.get())
+        """Generate the Excel report in a worker thread."""
+        selected_namespaces = self.check_namespaces_selected()
+        selected_resources = self.check_resources_selected()
+        if not selected_namespaces or not selected_resources:
+            return
+        
+        excel_file = self.excel_entry.get()
+        if not self.check_file_writable(excel_file, ".xlsx"):
+            messagebox.showerror("Error", "Invalid Excel file path or no write permission.")
+            self.log_status("Error: Invalid Excel file path or no write permission")
+            return
+        
+        selected_database_namespaces = self.warn_no_database_namespaces(selected_namespaces)
+        
+        def work():
+            from .reporter import ExcelReportGenerator
+            self.excel_reporter = ExcelReportGenerator(output_file=excel_file)
             
-            deployments = [] if "Deployment" not in selected_resources else self.collector.collect_summary()[0]
-            statefulsets = [] if "StatefulSet" not in selected_resources else self.collector.collect_summary()[1]
-            services = [] if "Service" not in selected_resources else self.collector.collect_summary()[2]
-            pvcs = [] if "PVC" not in selected_resources else self.collector.collect_summary()[3]
-            ingresses = [] if "Ingress" not in selected_resources else self.collector.collect_summary()[4]
-            pods = [] if "Pod" not in selected_resources else self.collector.collect_summary()[5]
-            secrets = [] if "Secret" not in selected_resources else self.collector.collect_summary()[6]
+            summary = self._get_summary(selected_namespaces, selected_database_namespaces)
+            deployments, statefulsets, services, pvcs, ingresses, pods, secrets = (
+                objects if resource in selected_resources else []
+                for resource, objects in zip(self.resource_types, summary)
+            )
             
             self.excel_reporter.generate_report(deployments, statefulsets, services, pvcs, ingresses, pods, secrets, selected_namespaces)
-            
-            self.log_status(f"Excel report generated: {self.excel_entry.get()}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to generate Excel report: {str(e)}")
-            self.log_status(f"Error: {str(e)}")
+            return f"Excel report generated: {excel_file}"
+        
+        self._run_in_background("Generating Excel report", work, "Failed to generate Excel report")
     
     def export_yaml(self):
-        """Export YAML files for all resources in selected namespaces."""
-        try:
-            selected_namespaces = self.check_namespaces_selected()
-            selected_resources = self.check_resources_selected()
-            if not selected_namespaces or not selected_resources:
+        """Export YAML files for all resources in selected namespaces in a worker thread."""
+        selected_namespaces = self.check_namespaces_selected()
+        selected_resources = self.check_resources_selected()
+        if not selected_namespaces or not selected_resources:
+            return
+        
+        export_dir = self.yaml_export_entry.get()
+        if not export_dir or not os.access(export_dir, os.W_OK):
+            if not export_dir:
+                export_dir = "k8s_yaml_export"
+            try:
+                os.makedirs(export_dir, exist_ok=True)
+            except Exception:
+                messagebox.showerror("Error", "Invalid YAML export directory or no write permission.")
+                self.log_status("Error: Invalid YAML export directory or no write permission")
                 return
+        
+        selected_database_namespaces = self.warn_no_database_namespaces(selected_namespaces)
+        bundle = self.bundle_yaml_var.get()
+        aggregate = self.aggregate_yaml_var.get()
+        
+        def work():
+            import io
+            import tarfile
+            import yaml
+            try:
+                from yaml import CSafeDumper as Dumper  # libyaml-backed emitter
+            except ImportError:
+                from yaml import SafeDumper as Dumper
             
-            export_dir = self.yaml_export_entry.get()
-            if not export_dir or not os.access(export_dir, os.W_OK):
-                if not export_dir:
-                    export_dir = "k8s_yaml_export"
-                try:
-                    os.makedirs(export_dir, exist_ok=True)
-                except Exception:
-                    messagebox.showerror("Error", "Invalid YAML export directory or no write permission.")
-                    self.log_status("Error: Invalid YAML export directory or no write permission")
-                    return
-            
-            selected_database_namespaces = self.warn_no_database_namespaces(selected_namespaces)
-            
-            client = KubernetesClient()
-            self.collector = ResourceCollector(selected_namespaces, selected_database_namespaces)
+            self.collector = self._new_collector(selected_namespaces, selected_database_namespaces)
             
             resources = self.collector.collect_resources()
             resource_types = {
@@ -662,28 +1179,85 @@ class K8sVisualizerGUI:
                 "secrets": resources[6] if "Secret" in selected_resources else []
             }
             
-            for ns in selected_namespaces:
-                ns_manifest = {"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": ns}}
-                with open(os.path.join(export_dir, f"{ns}_namespace.yaml"), "w") as f:
-                    yaml.dump(ns_manifest, f)
+            # All namespace manifests go into one multi-document namespaces.yaml. They differ only in
+            # the name, so the emitter is skipped unless the name would not read back as a string
+            resolver = yaml.resolver.Resolver()
             
+            def namespace_manifest(ns):
+                if resolver.resolve(yaml.ScalarNode, ns, (True, False)) == "tag:yaml.org,2002:str":
+                    return f"apiVersion: v1\nkind: Namespace\nmetadata:\n  name: {ns}\n"
+                return yaml.dump({"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": ns}}, Dumper=Dumper)
+            
+            namespaces_payload = "---\n".join(namespace_manifest(ns) for ns in selected_namespaces).encode("utf-8")
+            
+            # (namespace, file name within the namespace, manifest)
+            manifests = []
+            skipped = []
             for resource_type, resources in resource_types.items():
                 for resource in resources:
                     try:
-                        if hasattr(resource, 'metadata') and hasattr(resource.metadata, 'name') and hasattr(resource.metadata, 'namespace'):
-                            resource_name = resource.metadata.name
-                            ns = resource.metadata.namespace
-                            with open(os.path.join(export_dir, f"{ns}_{resource_name}_{resource_type}.yaml"), "w") as f:
-                                yaml.dump(resource.to_dict(), f)
-                        else:
-                            messagebox.showwarning("Warning", f"Skipping {resource_type} with missing metadata: {resource}")
+                        resource_name = resource.metadata.name
+                        ns = resource.metadata.namespace
+                        manifest = resource.to_dict()
                     except AttributeError as e:
-                        messagebox.showwarning("Warning", f"Skipping invalid {resource_type} object: {str(e)}")
+                        skipped.append(f"invalid {resource_type} object: {str(e)}")
+                        continue
+                    manifests.append((ns, f"{resource_name}_{resource_type}.yaml", manifest))
             
-            self.log_status(f"YAML files exported to: {export_dir}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Failed to export YAML: {str(e)}")
-            self.log_status(f"Error: {str(e)}")
+            def to_yaml(data):
+                return data if isinstance(data, bytes) else yaml.dump(data, Dumper=Dumper, encoding="utf-8")
+            
+            if aggregate:
+                # One multi-document file per namespace creates far fewer files than one per resource
+                by_namespace = {}
+                for ns, _, manifest in manifests:
+                    by_namespace.setdefault(ns, []).append(manifest)
+                manifests = [
+                    (ns, "all.yaml", yaml.dump_all(ns_manifests, Dumper=Dumper, encoding="utf-8"))
+                    for ns, ns_manifests in by_namespace.items()
+                ]
+            
+            if bundle:
+                # One compressed archive instead of one file per resource
+                export_target = os.path.join(export_dir, "manifests.tar.gz")
+                with tarfile.open(export_target, "w:gz") as tar:
+                    members = [("namespaces.yaml", namespaces_payload)]
+                    members.extend(
+                        (f"{ns}/{name}", to_yaml(data))
+                        for ns, name, data in manifests
+                    )
+                    for member, payload in members:
+                        info = tarfile.TarInfo(member)
+                        info.size = len(payload)
+                        info.mtime = time.time()
+                        tar.addfile(info, io.BytesIO(payload))
+            else:
+                export_target = export_dir
+                
+                def write_yaml(path, data):
+                    # Dump straight to UTF-8 bytes and write them unbuffered, skipping the text layer
+                    payload = memoryview(to_yaml(data))
+                    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                    try:
+                        while payload:
+                            payload = payload[os.write(fd, payload):]
+                    finally:
+                        os.close(fd)
+                
+                with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+                    futures = [executor.submit(write_yaml, os.path.join(export_dir, "namespaces.yaml"), namespaces_payload)]
+                    futures += [
+                        executor.submit(write_yaml, os.path.join(export_dir, f"{ns}_{name}"), data)
+                        for ns, name, data in manifests
+                    ]
+                    for future in futures:
+                        future.result()
+            
+            if skipped:
+                self._post(messagebox.showwarning, "Warning", f"Skipped {len(skipped)} resources:\n" + "\n".join(skipped[:20]))
+            return f"YAML files exported to: {export_target}"
+        
+        self._run_in_background("Exporting YAML", work, "Failed to export YAML")
     
     def open_svg(self):
         """Open the SVG file in the default application."""
@@ -693,10 +1267,7 @@ class K8sVisualizerGUI:
         
         if os.path.exists(svg_file):
             try:
-                if os.name == "nt":
-                    os.startfile(svg_file)
-                else:
-                    subprocess.run(["xdg-open", svg_file])
+                _open_in_default_app(svg_file)
                 self.log_status(f"Opened SVG: {svg_file}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to open SVG: {str(e)}")
@@ -710,10 +1281,7 @@ class K8sVisualizerGUI:
         csv_file = self.csv_entry.get()
         if os.path.exists(csv_file):
             try:
-                if os.name == "nt":
-                    os.startfile(csv_file)
-                else:
-                    subprocess.run(["xdg-open", csv_file])
+                _open_in_default_app(csv_file)
                 self.log_status(f"Opened CSV: {csv_file}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to open CSV: {str(e)}")
@@ -727,10 +1295,7 @@ class K8sVisualizerGUI:
         excel_file = self.excel_entry.get()
         if os.path.exists(excel_file):
             try:
-                if os.name == "nt":
-                    os.startfile(excel_file)
-                else:
-                    subprocess.run(["xdg-open", excel_file])
+                _open_in_default_app(excel_file)
                 self.log_status(f"Opened Excel: {excel_file}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to open Excel: {str(e)}")
@@ -738,6 +1303,16 @@ class K8sVisualizerGUI:
         else:
             messagebox.showwarning("Warning", f"Excel file not found: {excel_file}")
             self.log_status(f"Warning: Excel file not found: {excel_file}")
+    
+    def close(self):
+        """Drop queued handler tasks and close the window."""
+        self._closed = True
+        # Executor.shutdown(cancel_futures=True) needs Python 3.9
+        for future in list(self._futures):
+            future.cancel()
+        self._executor.shutdown(wait=False)
+        self.root.destroy()
+    
     def run(self):
         """Run the GUI main loop."""
         self.root.mainloop()
\ No newline at end of file
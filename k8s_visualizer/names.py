@@ -0,0 +1,38 @@
+# names.py
+import functools
+
+# Resource kinds in the order they are collected, visualized and reported
+RESOURCE_KINDS = ("deployments", "statefulsets", "services", "pvcs", "ingresses", "pods", "secrets")
+
+@functools.lru_cache(maxsize=4096)
+def shorten_name(name, max_len=30):
+    """Shorten a name with line breaks for display and return full name for tooltip.
+    
+    Results are memoized since the same names recur across refreshes.
+    
+    Args:
+        name (str): Resource name to shorten.
+        max_len (int): Maximum length before wrapping.
+    
+    Returns:
+        tuple: (display_name, full_name)
+    """
+    if len(name) <= max_len:
+        return name, name
+    pieces = []
+    wrapped_len = 0
+    current_len = 0
+    for part in name.split("-"):
+        if current_len + len(part) > max_len:
+            pieces.append("\\n")
+            pieces.append(part)
+            wrapped_len += len(part) + 2
+            current_len = len(part)
+        else:
+            if wrapped_len:
+                pieces.append("-")
+                wrapped_len += 1
+            pieces.append(part)
+            wrapped_len += len(part)
+            current_len += len(part) + 1
+    return "".join(pieces), name
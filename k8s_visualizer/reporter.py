@@ -1,6 +1,19 @@
 import csv
 import xlsxwriter
 from collections import Counter, defaultdict
+from .names import RESOURCE_KINDS
+
+# Report label of each resource kind
+COMPONENT_TYPES = {
+    "deployments": "Deployment",
+    "statefulsets": "StatefulSet",
+    "services": "Service",
+    "pvcs": "PVC",
+    "ingresses": "Ingress",
+    "pods": "Pod",
+    "secrets": "Secret",
+}
+HEADERS = ("ComponentType", "Name", "Namespace", "Replicas", "Status", "Parent", "RelatedComponents")
 
 class ReportGenerator:
     """Generates a CSV report of Kubernetes resources."""
@@ -26,130 +39,67 @@ class ReportGenerator:
             secrets (list): List of (name, namespace) tuples.
             namespaces (list): List of namespaces.
         """
-        # Prepare report data
-        report_data = []
-        
-        # Process deployments
-        for name, replicas, ns in deployments or []:
-            report_data.append({
-                "ComponentType": "Deployment",
-                "Name": name,
-                "Namespace": ns,
-                "Replicas": replicas,
-                "Status": "",
-                "Parent": "",
-                "RelatedComponents": ""
-            })
-        
-        # Process statefulsets
-        for name, replicas, ns in statefulsets or []:
-            report_data.append({
-                "ComponentType": "StatefulSet",
-                "Name": name,
-                "Namespace": ns,
-                "Replicas": replicas,
-                "Status": "",
-                "Parent": "",
-                "RelatedComponents": ""
-            })
-        
-        # Process services
-        for name, ns in services or []:
-            related = []
-            for dep_name, _, dep_ns in deployments or []:
-                if dep_ns == ns and name.replace("-service", "") in dep_name:
-                    related.append(f"Deployment:{dep_name}")
-            for sts_name, _, sts_ns in statefulsets or []:
-                if sts_ns == ns and name.replace("-service", "") in sts_name:
-                    related.append(f"StatefulSet:{sts_name}")
-            report_data.append({
-                "ComponentType": "Service",
-                "Name": name,
-                "Namespace": ns,
-                "Replicas": "",
-                "Status": "",
-                "Parent": "",
-                "RelatedComponents": ";".join(related)
-            })
-        
-        # Process PVCs
-        for name, ns in pvcs or []:
-            related = []
-            for dep_name, _, dep_ns in deployments or []:
-                if dep_ns == ns and name in dep_name:
-                    related.append(f"Deployment:{dep_name}")
-            for sts_name, _, sts_ns in statefulsets or []:
-                if sts_ns == ns and name in sts_name:
-                    related.append(f"StatefulSet:{sts_name}")
-            report_data.append({
-                "ComponentType": "PVC",
-                "Name": name,
-                "Namespace": ns,
-                "Replicas": "",
-                "Status": "",
-                "Parent": "",
-                "RelatedComponents": ";".join(related)
-            })
-        
-        # Process ingresses
-        for name, ns in ingresses or []:
-            related = [f"Service:{svc_name}" for svc_name, svc_ns in (services or []) if svc_ns == ns]
-            report_data.append({
-                "ComponentType": "Ingress",
-                "Name": name,
-                "Namespace": ns,
-                "Replicas": "",
-                "Status": "",
-                "Parent": "",
-                "RelatedComponents": ";".join(related)
-            })
-        
-        # Process pods
-        for pod_name, owners, ns, status in pods or []:
-            parent = ""
-            for owner in owners or []:
-                if owner and hasattr(owner, 'kind') and owner.kind == "ReplicaSet":
-                    parent = f"Deployment:{owner.name.rsplit('-', 1)[0]}"
-                elif owner and hasattr(owner, 'kind') and owner.kind == "StatefulSet":
-                    parent = f"StatefulSet:{owner.name}"
-            report_data.append({
-                "ComponentType": "Pod",
-                "Name": pod_name,
-                "Namespace": ns,
-                "Replicas": "",
-                "Status": status,
-                "Parent": parent,
-                "RelatedComponents": ""
-            })
+        resources = zip(RESOURCE_KINDS, (deployments, statefulsets, services, pvcs, ingresses, pods, secrets))
+        items = ((kind, item) for kind, objects in resources for item in objects or [])
+        self.generate_report_stream(items, namespaces)
+    
+    def generate_report_stream(self, items, namespaces):
+        """Generate a CSV report from resources as they arrive, writing each row immediately.
         
-        # Process secrets
-        for name, ns in secrets or []:
-            related = []
-            for dep_name, _, dep_ns in deployments or []:
-                if dep_ns == ns and name in dep_name:
-                    related.append(f"Deployment:{dep_name}")
-            for sts_name, _, sts_ns in statefulsets or []:
-                if sts_ns == ns and name in sts_name:
-                    related.append(f"StatefulSet:{sts_name}")
-            report_data.append({
-                "ComponentType": "Secret",
-                "Name": name,
-                "Namespace": ns,
-                "Replicas": "",
-                "Status": "",
-                "Parent": "",
-                "RelatedComponents": ";".join(related)
-            })
+        Only deployment, statefulset and service names are kept for the related-component
+        columns, so memory no longer grows with the number of pods, PVCs or secrets.
         
-        # Write to CSV
-        headers = ["ComponentType", "Name", "Namespace", "Replicas", "Status", "Parent", "RelatedComponents"]
-        with open(self.output_file, "w", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=headers)
-            writer.writeheader()
-            for row in report_data:
-                writer.writerow(row)
+        Args:
+            items (iterable): (kind, summary tuple) pairs as yielded by
+                ResourceCollector.iter_summary, in RESOURCE_KINDS order.
+            namespaces (list): List of namespaces.
+        """
+        # A 1 MiB buffer turns the per-row writes into a few large ones
+        with open(self.output_file, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            writer.writerow(HEADERS)
+            writer.writerows(self._rows(items))
         
         print(f"CSV report generated: {self.output_file}")
+    
+    @staticmethod
+    def _rows(items):
+        """Yield one CSV row per (kind, summary tuple) pair."""
+        # Names indexed by namespace, so related components are only searched within one namespace
+        deployments = defaultdict(list)
+        statefulsets = defaultdict(list)
+        services = defaultdict(list)
+        for kind, item in items:
+            if kind == "deployments":
+                name, replicas, ns = item
+                deployments[ns].append(name)
+                yield ("Deployment", name, ns, replicas, "", "", "")
+            elif kind == "statefulsets":
+                name, replicas, ns = item
+                statefulsets[ns].append(name)
+                yield ("StatefulSet", name, ns, replicas, "", "", "")
+            elif kind == "pods":
+                pod_name, owners, ns, status = item
+                parent = ""
+                for owner in owners or []:
+                    if owner and hasattr(owner, 'kind') and owner.kind == "ReplicaSet":
+                        parent = f"Deployment:{owner.name.rsplit('-', 1)[0]}"
+                    elif owner and hasattr(owner, 'kind') and owner.kind == "StatefulSet":
+                        parent = f"StatefulSet:{owner.name}"
+                yield ("Pod", pod_name, ns, "", status, parent, "")
+            else:
+                name, ns = item
+                if kind == "ingresses":
+                    related = [f"Service:{svc_name}" for svc_name in services.get(ns, ())]
+                else:
+                    if kind == "services":
+                        services[ns].append(name)
+                        stem = name.replace("-service", "")
+                    else:
+                        stem = name
+                    related = [f"Deployment:{dep_name}" for dep_name in deployments.get(ns, ()) if stem in dep_name]
+                    related += [f"StatefulSet:{sts_name}" for sts_name in statefulsets.get(ns, ()) if stem in sts_name]
+                yield (COMPONENT_TYPES[kind], name, ns, "", "", "", ";".join(related))
 
 class ExcelReportGenerator:
     """Generates an Excel report of Kubernetes resources with charts."""
@@ -158,29 +108,42 @@ class ExcelReportGenerator:
         self.output_file = output_file
     
     def generate_report(self, deployments, statefulsets, services, pvcs, ingresses, pods, secrets, namespaces):
-        workbook = xlsxwriter.Workbook(self.output_file)
+        # Rows are written strictly top to bottom, so each one can be flushed to disk as soon as
+        # the next starts; resource names are never URLs or formulas, so skip scanning for them
+        workbook = xlsxwriter.Workbook(self.output_file, {
+            'constant_memory': True,
+            'strings_to_formulas': False,
+            'strings_to_urls': False,
+        })
         worksheet = workbook.add_worksheet("Resources")
         bold = workbook.add_format({'bold': True})
-
+        
         # Headers
         headers = ["ComponentType", "Name", "Namespace", "Replicas", "Status", "Parent", "RelatedComponents"]
         worksheet.write_row(0, 0, headers, bold)
         
+        # Namespace-wise counts are taken in the same pass that writes the rows
+        ns_component_counts = defaultdict(lambda: Counter())
         row = 1
         for name, replicas, ns in deployments or []:
             worksheet.write_row(row, 0, ["Deployment", name, ns, replicas, "", "", ""])
+            ns_component_counts[ns]['Deployment'] += 1
             row += 1
         for name, replicas, ns in statefulsets or []:
             worksheet.write_row(row, 0, ["StatefulSet", name, ns, replicas, "", "", ""])
+            ns_component_counts[ns]['StatefulSet'] += 1
             row += 1
         for name, ns in services or []:
             worksheet.write_row(row, 0, ["Service", name, ns, "", "", "", ""])
+            ns_component_counts[ns]['Service'] += 1
             row += 1
         for name, ns in pvcs or []:
             worksheet.write_row(row, 0, ["PVC", name, ns, "", "", "", ""])
+            ns_component_counts[ns]['PVC'] += 1
             row += 1
         for name, ns in ingresses or []:
             worksheet.write_row(row, 0, ["Ingress", name, ns, "", "", "", ""])
+            ns_component_counts[ns]['Ingress'] += 1
             row += 1
         for pod_name, owners, ns, status in pods or []:
             parent = ""
@@ -190,13 +153,15 @@ class ExcelReportGenerator:
                 elif owner and hasattr(owner, 'kind') and owner.kind == "StatefulSet":
                     parent = f"StatefulSet:{owner.name}"
             worksheet.write_row(row, 0, ["Pod", pod_name, ns, "", status, parent, ""])
+            ns_component_counts[ns]['Pod'] += 1
             row += 1
         for name, ns in secrets or []:
             worksheet.write_row(row, 0, ["Secret", name, ns, "", "", "", ""])
+            ns_component_counts[ns]['Secret'] += 1
             row += 1
-
+        
         # Component type counts (overall)
-        component_counts = Counter({
+        component_counts = {
             "Deployment": len(deployments or []),
             "StatefulSet": len(statefulsets or []),
             "Service": len(services or []),
@@ -205,18 +170,20 @@ class ExcelReportGenerator:
             "Pod": len(pods or []),
             "Secret": len(secrets or []),
             "Namespace": len(namespaces or []),
-        })
-
+        }
+        
         chart_start_row = row + 2
         worksheet.write(chart_start_row, 0, "ResourceType", bold)
         worksheet.write(chart_start_row, 1, "Count", bold)
         for idx, (k, v) in enumerate(component_counts.items()):
             worksheet.write(chart_start_row + 1 + idx, 0, k)
             worksheet.write(chart_start_row + 1 + idx, 1, v)
-
+        
         # Colors
         colors = ['#4F81BD', '#C0504D', '#9BBB59', '#8064A2', '#4BACC6', '#F79646', '#7F7F7F', '#A9A9A9']
-
+        # Every chart slices its point fills from one list instead of building new dicts
+        point_fills = [{'fill': {'color': c}} for c in colors]
+        
         # Overall pie chart
         pie_chart = workbook.add_chart({'type': 'pie'})
         pie_chart.add_series({
@@ -224,7 +191,7 @@ class ExcelReportGenerator:
             'categories': ['Resources', chart_start_row + 1, 0, chart_start_row + len(component_counts), 0],
             'values':     ['Resources', chart_start_row + 1, 1, chart_start_row + len(component_counts), 1],
             'data_labels': {'percentage': True, 'value': True, 'leader_lines': True},
-            'points': [{'fill': {'color': c}} for c in colors]
+            'points': point_fills
         })
         pie_chart.set_title({
             'name': 'Kubernetes Resource Distribution',
@@ -233,24 +200,7 @@ class ExcelReportGenerator:
         pie_chart.set_legend({'position': 'bottom'})
         pie_chart.set_chartarea({'border': {'color': 'black'}, 'fill': {'color': '#F2F2F2'}})
         worksheet.insert_chart('H2', pie_chart)
-
-        # Namespace-wise counts
-        ns_component_counts = defaultdict(lambda: Counter())
-        for name, _, ns in deployments or []:
-            ns_component_counts[ns]['Deployment'] += 1
-        for name, _, ns in statefulsets or []:
-            ns_component_counts[ns]['StatefulSet'] += 1
-        for name, ns in services or []:
-            ns_component_counts[ns]['Service'] += 1
-        for name, ns in pvcs or []:
-            ns_component_counts[ns]['PVC'] += 1
-        for name, ns in ingresses or []:
-            ns_component_counts[ns]['Ingress'] += 1
-        for name, _, ns, _ in pods or []:
-            ns_component_counts[ns]['Pod'] += 1
-        for name, ns in secrets or []:
-            ns_component_counts[ns]['Secret'] += 1
-
+        
         # Add per-namespace summary and column charts
         ns_chart_start = chart_start_row + len(component_counts) + 5
         for ns_idx, (ns, counts) in enumerate(ns_component_counts.items()):
@@ -269,11 +219,11 @@ class ExcelReportGenerator:
                 'name': f"{ns} Resources",
                 'categories': ['Resources', ns_row + 2, 0, ns_row + 1 + len(counts), 0],
                 'values': ['Resources', ns_row + 2, 1, ns_row + 1 + len(counts), 1],
-                'points': [{'fill': {'color': colors[i % len(colors)]}} for i in range(len(counts))]
+                'points': point_fills[:len(counts)]
             })
             ns_chart.set_title({'name': f'Resources in {ns}'})
             ns_chart.set_legend({'none': True})
             worksheet.insert_chart(ns_row, 4, ns_chart)
-
+        
         workbook.close()
         print(f"Excel report with charts generated: {self.output_file}")
\ No newline at end of file
@@ -1,5 +1,66 @@
 #visualizer.py
-from graphviz import Digraph
+import bisect
+import functools
+import graphviz
+from collections import defaultdict
+from graphviz import Digraph, quoting
+from .names import shorten_name
+
+# Node shape per resource type when none is given
+DEFAULT_NODE_SHAPES = {
+    "Deployment": "box3d",
+    "StatefulSet": "tab",
+    "Service": "component",
+    "PVC": "cylinder",
+    "Ingress": "ellipse",
+    "Pod": "box",
+    "Secret": "folder"
+}
+
+# DOT quoting is pure, and node names recur in every edge that touches them
+_quote = functools.lru_cache(maxsize=65536)(quoting.quote)
+_quote_edge = functools.lru_cache(maxsize=65536)(quoting.quote_edge)
+
+def _dot_node(name, label, fillcolor, shape, style, tooltip):
+    """Return the DOT node statement Digraph.node would emit for these attributes."""
+    return (
+        f"\t{_quote(name)} [label={_quote(label)} fillcolor={_quote(fillcolor)}"
+        f" shape={_quote(shape)} style={_quote(style)} tooltip={_quote(tooltip)}]\n"
+    )
+
+def _dot_edge(tail, head, label=None):
+    """Return the DOT edge statement Digraph.edge would emit."""
+    attrs = f" [label={_quote(label)}]" if label is not None else ""
+    return f"\t{_quote_edge(tail)} -> {_quote_edge(head)}{attrs}\n"
+
+def _name_index(names):
+    """Join names into one NUL-separated string with each name's start offset, for _containing."""
+    starts = []
+    offset = 0
+    for name in names:
+        starts.append(offset)
+        offset += len(name) + 1
+    return "\0".join(names), starts
+
+def _containing(needle, names, index):
+    """Yield the positions of the names that contain needle as a substring, in order.
+    
+    One str.find scan over the joined names replaces a `needle in name` test per name.
+    No name contains the NUL separator, so a match never spans two names.
+    
+    Args:
+        needle (str): Substring to look for.
+        names (list): Names to search.
+        index (tuple): _name_index(names).
+    """
+    if not names:
+        return
+    joined, starts = index
+    pos = joined.find(needle)
+    while pos != -1:
+        i = bisect.bisect_right(starts, pos) - 1
+        yield i
+        pos = joined.find(needle, starts[i] + len(names[i]) + 1)
 
 class ResourceVisualizer:
     """Visualizes Kubernetes resources as a Graphviz diagram."""
@@ -15,15 +76,7 @@ class ResourceVisualizer:
         """
         self.output_file = output_file
         self.output_format = output_format
-        self.node_shapes = node_shapes or {
-            "Deployment": "box3d",
-            "StatefulSet": "tab",
-            "Service": "component",
-            "PVC": "cylinder",
-            "Ingress": "ellipse",
-            "Pod": "box",
-            "Secret": "folder"
-        }
+        self.node_shapes = node_shapes or dict(DEFAULT_NODE_SHAPES)
         self.namespace_colors = namespace_colors
         self.dot = Digraph("GKE_Architecture", format=output_format)
         self.dot.attr(
@@ -52,36 +105,29 @@ class ResourceVisualizer:
             secrets (list): List of (name, namespace) tuples.
             namespaces (list): List of namespaces.
         """
-        ns_map = {ns: {"dep": [], "sts": [], "svc": [], "pvc": [], "ing": [], "pods": [], "sec": []} for ns in namespaces}
+        # Buckets are only created for namespaces that hold resources
+        ns_map = defaultdict(lambda: {"dep": [], "sts": [], "svc": [], "pvc": [], "ing": [], "pods": [], "sec": []})
         dep_replicas = {}
         sts_replicas = {}
+        # shorten_name is memoized and already returns the (display_name, full_name) pair stored per node
+        shorten = shorten_name
         
         # Process deployments
         for d, replica_count, ns in deployments:
-            display_name, full_name = self._shorten(d)
-            ns_map[ns]["dep"].append((display_name, full_name))
-            dep_replicas[display_name] = replica_count
+            names = shorten(d)
+            ns_map[ns]["dep"].append(names)
+            dep_replicas[names[0]] = replica_count
         
         # Process statefulsets
         for s, replica_count, ns in statefulsets:
-            display_name, full_name = self._shorten(s)
-            ns_map[ns]["sts"].append((display_name, full_name))
-            sts_replicas[display_name] = replica_count
-        
-        # Process services
-        for s, ns in services:
-            display_name, full_name = self._shorten(s)
-            ns_map[ns]["svc"].append((display_name, full_name))
+            names = shorten(s)
+            ns_map[ns]["sts"].append(names)
+            sts_replicas[names[0]] = replica_count
         
-        # Process PVCs
-        for p, ns in pvcs:
-            display_name, full_name = self._shorten(p)
-            ns_map[ns]["pvc"].append((display_name, full_name))
-        
-        # Process ingresses
-        for i, ns in ingresses:
-            display_name, full_name = self._shorten(i)
-            ns_map[ns]["ing"].append((display_name, full_name))
+        # Process services, PVCs, ingresses and secrets
+        for items, key in ((services, "svc"), (pvcs, "pvc"), (ingresses, "ing"), (secrets, "sec")):
+            for name, ns in items:
+                ns_map[ns][key].append(shorten(name))
         
         # Process pods
         for pod_name, owners, ns, status in pods:
@@ -95,109 +141,119 @@ class ResourceVisualizer:
                     owner_name = owner.name
                     owner_type = "StatefulSet"
             if owner_name and owner_type:
-                display_pod, full_pod = self._shorten(pod_name)
-                display_owner, _ = self._shorten(owner_name)
+                display_pod, full_pod = shorten(pod_name)
+                display_owner = shorten(owner_name)[0]
                 ns_map[ns]["pods"].append((display_pod, display_owner, full_pod, status, owner_type))
         
-        # Process secrets
-        for s, ns in secrets:
-            display_name, full_name = self._shorten(s)
-            ns_map[ns]["sec"].append((display_name, full_name))
-        
         # Build the diagram
-        for ns, resources in ns_map.items():
+        # Namespaces without resources get no cluster. Selected namespaces keep their order,
+        # followed by any others a resource was found in
+        for ns in dict.fromkeys([*(ns for ns in namespaces if ns in ns_map), *ns_map]):
+            resources = ns_map[ns]
             with self.dot.subgraph(name=f"cluster_{ns}") as cluster:
                 if self.namespace_colors is None:  
                     self.namespace_colors = {}
                 cluster.attr(label=f"Namespace: {ns}", style="filled", fillcolor=self.namespace_colors.get(ns, "#E6F3FF"))
+                # Statements are formatted here and added to the cluster body in one go
+                lines = []
                 # Add ingress nodes
                 for ing, full_ing in resources["ing"]:
-                    cluster.node(f"{ns}_ing_{ing}", f"Ingress: {ing}", shape=self.node_shapes["Ingress"], fillcolor="#C8E6C9", style="filled", tooltip=full_ing)
+                    lines.append(_dot_node(f"{ns}_ing_{ing}", f"Ingress: {ing}", "#C8E6C9", self.node_shapes["Ingress"], "filled", full_ing))
                 
                 # Add service nodes
                 for svc, full_svc in resources["svc"]:
-                    cluster.node(f"{ns}_svc_{svc}", f"Service: {svc}", shape=self.node_shapes["Service"], fillcolor="#B2DFDB", style="filled", tooltip=full_svc)
+                    lines.append(_dot_node(f"{ns}_svc_{svc}", f"Service: {svc}", "#B2DFDB", self.node_shapes["Service"], "filled", full_svc))
                 
                 # Add deployment nodes
                 for dep, full_dep in resources["dep"]:
                     replica_text = f"Deployment: {dep}\\nReplicas: {dep_replicas.get(dep, 0)}"
                     style = "filled,bold" if dep_replicas.get(dep, 0) == 0 else "filled"
-                    cluster.node(f"{ns}_dep_{dep}", replica_text, shape=self.node_shapes["Deployment"], fillcolor="#FFF9C4", style=style, tooltip=full_dep)
+                    lines.append(_dot_node(f"{ns}_dep_{dep}", replica_text, "#FFF9C4", self.node_shapes["Deployment"], style, full_dep))
                 
                 # Add statefulset nodes
                 for sts, full_sts in resources["sts"]:
                     replica_text = f"StatefulSet: {sts}\\nReplicas: {sts_replicas.get(sts, 0)}"
                     style = "filled,bold" if sts_replicas.get(sts, 0) == 0 else "filled"
-                    cluster.node(f"{ns}_sts_{sts}", replica_text, shape=self.node_shapes["StatefulSet"], fillcolor="#BBDEFB", style=style, tooltip=full_sts)
+                    lines.append(_dot_node(f"{ns}_sts_{sts}", replica_text, "#BBDEFB", self.node_shapes["StatefulSet"], style, full_sts))
                 
                 # Add PVC nodes
                 for pvc, full_pvc in resources["pvc"]:
-                    cluster.node(f"{ns}_pvc_{pvc}", f"PVC: {pvc}", shape=self.node_shapes["PVC"], fillcolor="#FFECB3", style="filled", tooltip=full_pvc)
+                    lines.append(_dot_node(f"{ns}_pvc_{pvc}", f"PVC: {pvc}", "#FFECB3", self.node_shapes["PVC"], "filled", full_pvc))
                 
                 # Add secret nodes
                 for sec, full_sec in resources["sec"]:
-                    cluster.node(f"{ns}_sec_{sec}", f"Secret: {sec}", shape=self.node_shapes["Secret"], fillcolor="#D3D3D3", style="filled", tooltip=full_sec)
+                    lines.append(_dot_node(f"{ns}_sec_{sec}", f"Secret: {sec}", "#D3D3D3", self.node_shapes["Secret"], "filled", full_sec))
                 
                 # Add pod nodes with status
                 for pod, parent, full_pod, status, owner_type in resources["pods"]:
-                    cluster.node(f"{ns}_pod_{pod}", f"Pod: {pod}\\nStatus: {status}", shape=self.node_shapes["Pod"], fillcolor="#E1BEE7", style="filled", tooltip=full_pod)
+                    lines.append(_dot_node(f"{ns}_pod_{pod}", f"Pod: {pod}\\nStatus: {status}", "#E1BEE7", self.node_shapes["Pod"], "filled", full_pod))
                     if owner_type == "Deployment":
-                        cluster.edge(f"{ns}_dep_{parent}", f"{ns}_pod_{pod}")
+                        lines.append(_dot_edge(f"{ns}_dep_{parent}", f"{ns}_pod_{pod}"))
                     elif owner_type == "StatefulSet":
-                        cluster.edge(f"{ns}_sts_{parent}", f"{ns}_pod_{pod}")
+                        lines.append(_dot_edge(f"{ns}_sts_{parent}", f"{ns}_pod_{pod}"))
                 
                 # Add edges with labels
                 for ing, _ in resources["ing"]:
                     for svc, _ in resources["svc"]:
-                        cluster.edge(f"{ns}_ing_{ing}", f"{ns}_svc_{svc}", label="routes to")
+                        lines.append(_dot_edge(f"{ns}_ing_{ing}", f"{ns}_svc_{svc}", label="routes to"))
+                
+                # Name matches are substring tests; each is answered by one scan over the joined names
+                dep_names = [dep for dep, _ in resources["dep"]]
+                sts_names = [sts for sts, _ in resources["sts"]]
+                dep_index = _name_index(dep_names)
+                sts_index = _name_index(sts_names)
                 
                 for svc, _ in resources["svc"]:
-                    for dep, _ in resources["dep"]:
-                        if svc.replace("-service", "") in dep:
-                            cluster.edge(f"{ns}_svc_{svc}", f"{ns}_dep_{dep}", label="exposes")
-                    for sts, _ in resources["sts"]:
-                        if svc.replace("-service", "") in sts:
-                            cluster.edge(f"{ns}_svc_{svc}", f"{ns}_sts_{sts}", label="exposes")
+                    stem = svc.replace("-service", "")
+                    for i in _containing(stem, dep_names, dep_index):
+                        lines.append(_dot_edge(f"{ns}_svc_{svc}", f"{ns}_dep_{dep_names[i]}", label="exposes"))
+                    for i in _containing(stem, sts_names, sts_index):
+                        lines.append(_dot_edge(f"{ns}_svc_{svc}", f"{ns}_sts_{sts_names[i]}", label="exposes"))
+                
+                # Workload position -> PVCs and secrets whose names it contains, in their original order
+                dep_pvcs, dep_secs, sts_pvcs, sts_secs = {}, {}, {}, {}
+                for pvc, _ in resources["pvc"]:
+                    for i in _containing(pvc, dep_names, dep_index):
+                        dep_pvcs.setdefault(i, []).append(pvc)
+                    for i in _containing(pvc, sts_names, sts_index):
+                        sts_pvcs.setdefault(i, []).append(pvc)
+                for sec, _ in resources["sec"]:
+                    for i in _containing(sec, dep_names, dep_index):
+                        dep_secs.setdefault(i, []).append(sec)
+                    for i in _containing(sec, sts_names, sts_index):
+                        sts_secs.setdefault(i, []).append(sec)
                 
-                for dep, _ in resources["dep"]:
-                    for pvc, _ in resources["pvc"]:
-                        if pvc in dep:
-                            cluster.edge(f"{ns}_dep_{dep}", f"{ns}_pvc_{pvc}", label="binds")
-                    for sec, _ in resources["sec"]:
-                        if sec in dep:
-                            cluster.edge(f"{ns}_dep_{dep}", f"{ns}_sec_{sec}", label="uses")
+                for i, dep in enumerate(dep_names):
+                    for pvc in dep_pvcs.get(i, ()):
+                        lines.append(_dot_edge(f"{ns}_dep_{dep}", f"{ns}_pvc_{pvc}", label="binds"))
+                    for sec in dep_secs.get(i, ()):
+                        lines.append(_dot_edge(f"{ns}_dep_{dep}", f"{ns}_sec_{sec}", label="uses"))
                 
-                for sts, _ in resources["sts"]:
-                    for pvc, _ in resources["pvc"]:
-                        if pvc in sts:
-                            cluster.edge(f"{ns}_sts_{sts}", f"{ns}_pvc_{pvc}", label="binds")
-                    for sec, _ in resources["sec"]:
-                        if sec in sts:
-                            cluster.edge(f"{ns}_sts_{sts}", f"{ns}_sec_{sec}", label="uses")
+                for i, sts in enumerate(sts_names):
+                    for pvc in sts_pvcs.get(i, ()):
+                        lines.append(_dot_edge(f"{ns}_sts_{sts}", f"{ns}_pvc_{pvc}", label="binds"))
+                    for sec in sts_secs.get(i, ()):
+                        lines.append(_dot_edge(f"{ns}_sts_{sts}", f"{ns}_sec_{sec}", label="uses"))
+                
+                cluster.body.extend(lines)
                 
                 for ing, _ in resources["ing"]:
-                    self.dot.edge("CloudLB", f"{ns}_ing_{ing}", label="routes to")
+                    self.dot.body.append(_dot_edge("CloudLB", f"{ns}_ing_{ing}", label="routes to"))
                 
-    def _shorten(self, name, max_len=30):
-        """Shorten a name with line breaks for display and return full name for tooltip."""
-        if len(name) <= max_len:
-            return name, name
-        parts = name.split("-")
-        wrapped = ""
-        current_len = 0
-        for part in parts:
-            if current_len + len(part) > max_len:
-                wrapped += "\\n" + part
-                current_len = len(part)
-            else:
-                wrapped += ("-" if wrapped else "") + part
-                current_len += len(part) + 1
-        return wrapped, name
-    
     def render(self, view=True):
         """Render the diagram to a file.
         
+        The DOT source is piped to Graphviz on stdin rather than saved as an intermediate file.
+        
         Args:
             view (bool): Whether to open the rendered file.
+        
+        Returns:
+            str: Path of the rendered file.
         """
-        self.dot.render(self.output_file, view=view)
\ No newline at end of file
+        filepath = f"{self.output_file}.{self.output_format}"
+        with open(filepath, "wb") as f:
+            f.write(self.dot.pipe(format=self.output_format))
+        if view:
+            graphviz.view(filepath)
+        return filepath
\ No newline at end of file
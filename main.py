@@ -1,29 +1,95 @@
-from k8s_visualizer.collector import ResourceCollector
-from k8s_visualizer.visualizer import ResourceVisualizer
-from k8s_visualizer.reporter import ReportGenerator, ExcelReportGenerator
-import tkinter as tk
-from ttkthemes import ThemedTk
-from k8s_visualizer.gui import K8sVisualizerGUI
-def main():
-    # # Define namespaces to visualize
-    # namespaces = ["lamprell", "lamprell-dev", "test-argocd", "redis-prod", "redis-nonprd", "mongodb", "rabbitmq", "monitor"]
-    # database_namespaces = {"redis-prod", "redis-nonprd", "mongodb", "rabbitmq"}
-    # # Initialize collector, visualizer, and reporter
-    # collector = ResourceCollector(namespaces, database_namespaces)
-    # visualizer = ResourceVisualizer(output_file="gke_architecture", output_format="svg")
-    # reporter = ExcelReportGenerator(output_file="gke_components_report.xlsx")
-    # csv = ReportGenerator(output_file="gke_components_report.csv")
-    # # Collect resources
-    # deployments, statefulsets, services, pvcs, ingresses, pods, secrets = collector.collect_summary()
+import argparse
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+# Database namespaces used when --db-ns is not given
+DB_NAMESPACES = frozenset({"redis-prod", "redis-nonprd", "mongodb", "rabbitmq"})
+
+def parse_args(argv=None):
+    """Parse the command line.
+    
+    Runs before tkinter is imported, so --help and headless runs never load Tcl/Tk.
+    
+    Args:
+        argv (list, optional): Arguments to parse. Defaults to sys.argv[1:].
+    
+    Returns:
+        argparse.Namespace: Parsed arguments.
+    """
+    parser = argparse.ArgumentParser(
+        description="Visualize and report Kubernetes resources. The GUI is started unless --headless "
+                    "or one of the headless-only options (--namespaces, --db-ns, --output-dir) is given."
+    )
+    parser.add_argument("--headless", action="store_true",
+                        help="Write the diagram and reports without opening the GUI")
+    parser.add_argument("--namespaces", nargs="+", default=[],
+                        help="Namespaces to collect; implies --headless (default in headless mode: all namespaces)")
+    parser.add_argument("--db-ns", nargs="*", default=None,
+                        help=f"Database namespaces, whose deployments are skipped; implies --headless (default: {' '.join(sorted(DB_NAMESPACES))})")
+    parser.add_argument("--max-workers", type=int, default=None,
+                        help="Most concurrent Kubernetes API requests per collection (default: 16)")
+    parser.add_argument("--output-dir", default=None,
+                        help="Directory the diagram and reports are written to; implies --headless (default: current directory)")
+    args = parser.parse_args(argv)
+    if args.max_workers is not None and args.max_workers < 1:
+        parser.error("--max-workers must be at least 1")
+    args.headless = args.headless or bool(args.namespaces) or args.db_ns is not None or args.output_dir is not None
+    if args.db_ns is None:
+        args.db_ns = DB_NAMESPACES
+    if args.output_dir is None:
+        args.output_dir = "."
+    return args
+
+def run_pipeline(namespaces, database_namespaces, max_workers=None, output_dir="."):
+    """Collect the namespaces once and write the SVG diagram, Excel report and CSV report.
+    
+    Args:
+        namespaces (list): Namespaces to collect resources from. Empty for all namespaces.
+        database_namespaces (frozenset): Namespaces for which deployments are skipped.
+        max_workers (int, optional): Most concurrent API requests. Defaults to None (collector default).
+        output_dir (str): Directory the outputs are written to, created if missing.
+    """
+    from k8s_visualizer.client import KubernetesClient
+    from k8s_visualizer.collector import ResourceCollector
+    from k8s_visualizer.visualizer import ResourceVisualizer
+    from k8s_visualizer.reporter import ReportGenerator, ExcelReportGenerator
+    
+    client = KubernetesClient()
+    namespaces = namespaces or client.list_namespaces()
+    if not namespaces:
+        sys.exit("Error: No namespaces found in the cluster.")
+    os.makedirs(output_dir, exist_ok=True)
+    collector = ResourceCollector(namespaces, database_namespaces, max_workers=max_workers, client=client)
+    visualizer = ResourceVisualizer(output_file=os.path.join(output_dir, "gke_architecture"), output_format="svg")
+    reporter = ExcelReportGenerator(output_file=os.path.join(output_dir, "gke_components_report.xlsx"))
+    csv = ReportGenerator(output_file=os.path.join(output_dir, "gke_components_report.csv"))
     
-    # # Generate CSV report
-    # reporter.generate_report(deployments, statefulsets, services, pvcs, ingresses, pods,secrets, namespaces)
-    # csv.generate_report(deployments, statefulsets, services, pvcs, ingresses, pods, secrets, namespaces)
-    # # Build and render diagram
-    # visualizer.build_diagram(deployments, statefulsets, services, pvcs, ingresses, pods, secrets, namespaces)
-    # visualizer.render(view=True)
+    # Collect resources
+    summary = collector.collect_summary()
+    
+    # The outputs only read the shared summary, so the reports are written while the diagram renders
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(reporter.generate_report, *summary, namespaces),
+            executor.submit(csv.generate_report, *summary, namespaces),
+        ]
+        
+        # Build and render diagram
+        visualizer.build_diagram(*summary, namespaces)
+        print(f"Visualization generated: {visualizer.render(view=False)}")
+        for future in futures:
+            future.result()
+
+def main(argv=None):
+    args = parse_args(argv)
+    if args.headless:
+        run_pipeline(args.namespaces, frozenset(args.db_ns), args.max_workers, args.output_dir)
+        return
+    import tkinter as tk
+    from k8s_visualizer.gui import K8sVisualizerGUI
     root = tk.Tk()
-    app = K8sVisualizerGUI(root)
+    app = K8sVisualizerGUI(root, collector_workers=args.max_workers)
     app.run()
 
 